@@ -2,6 +2,7 @@
 Travel-related API endpoints for RoamAI.
 """
 
+import asyncio
 import logging
 from datetime import date, datetime
 from typing import List, Optional, Dict, Any
@@ -81,7 +82,7 @@ async def get_destination_recommendations(preferences: UserPreferenceRequest):
         )
         
         # Get recommendations from service
-        recommendations = travel_planner.recommend_destinations(user_prefs)
+        recommendations = await asyncio.to_thread(travel_planner.recommend_destinations, user_prefs)
         
         # Convert to response model
         response = []
@@ -143,7 +144,7 @@ async def create_travel_itinerary(
             traveler_dict.update(traveler_details.additional_details)
         
         # Create itinerary
-        itinerary = travel_planner.create_and_book_itinerary(
+        itinerary = await travel_planner.create_and_book_itinerary_async(
             user_prefs, destination, traveler_dict
         )
         
@@ -165,7 +166,7 @@ async def get_trending_destinations(region: Optional[str] = None):
     Get trending destinations, optionally filtered by region.
     """
     try:
-        return travel_planner.get_trending_destinations(region)
+        return await asyncio.to_thread(travel_planner.get_trending_destinations, region)
     except Exception as e:
         logger.error(f"Error getting trending destinations: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -176,7 +177,7 @@ async def get_destination_social_content(destination: str):
     Get social media content for a specific destination.
     """
     try:
-        return travel_planner.get_destination_social_content(destination)
+        return await asyncio.to_thread(travel_planner.get_destination_social_content, destination)
     except Exception as e:
         logger.error(f"Error getting social content: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -201,7 +202,7 @@ async def get_pilgrimage_information(preferences: UserPreferenceRequest):
             special_requirements=preferences.special_requirements
         )
         
-        return travel_planner.get_pilgrimage_info(user_prefs)
+        return await asyncio.to_thread(travel_planner.get_pilgrimage_info, user_prefs)
     except Exception as e:
         logger.error(f"Error getting pilgrimage information: {e}")
         raise HTTPException(status_code=500, detail=str(e))
\ No newline at end of file
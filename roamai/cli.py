@@ -10,7 +10,6 @@ import json
 from .core.config import settings
 from .models.travel import UserPreferences, Location, TravelStyle, TravelInterest
 from .services.travel_planner import TravelPlannerService
-from .utils.helpers import serialize_dates
 
 # Setup logging
 logging.basicConfig(
@@ -84,7 +83,7 @@ def main():
             logger.error("No destinations found matching the preferences")
         else:
             # Convert recommendations to serializable format
-            recommendations_dict = [json.loads(r.model_dump_json()) for r in recommendations]
+            recommendations_dict = [r.model_dump(mode="json") for r in recommendations]
             
             # Save to output file
             with open(args.output, "w") as f:
@@ -106,9 +105,6 @@ def main():
         if not trending:
             logger.error("No trending destinations found")
         else:
-            # Serialize dates
-            trending = serialize_dates(trending)
-            
             # Save to output file
             with open(args.output, "w") as f:
                 json.dump(trending, f, indent=2)
@@ -3,7 +3,6 @@ Interactive CLI client for RoamAI.
 """
 
 import logging
-import json
 import os
 import sys
 from datetime import datetime, date, timedelta
@@ -14,7 +13,7 @@ from roamai.models.travel import (
 )
 from roamai.services.travel_planner import TravelPlannerService
 from roamai.services.notification_service import NotificationService
-from roamai.utils.helpers import format_currency, format_date
+from roamai.utils.helpers import format_currency, format_date, itinerary_to_dict
 
 # Setup logging
 logging.basicConfig(
@@ -341,7 +340,7 @@ def main():
                 
                 if itinerary:
                     # Convert to dictionary for easier display
-                    itinerary_dict = json.loads(itinerary.model_dump_json())
+                    itinerary_dict = itinerary_to_dict(itinerary)
                     
                     # Send confirmation email
                     notification_service.send_booking_confirmation(
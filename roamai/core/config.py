@@ -16,6 +16,7 @@ class Settings(BaseSettings):
     
     # API Keys
     OPENAI_API_KEY: str = os.environ.get("OPENAI_API_KEY", "")
+    OPENAI_API_KEYS: str = os.environ.get("OPENAI_API_KEYS", "")  # Optional comma-separated extra keys, used round-robin
     
     # Application settings
     APP_NAME: str = "RoamAI"
@@ -27,10 +28,22 @@ class Settings(BaseSettings):
     
     # Model settings
     DEFAULT_MODEL: str = "gpt-4o"  # The newest OpenAI model is "gpt-4o" which was released May 13, 2024
+    OPENAI_SEED: int = 42  # Sampling seed for reproducible, cacheable reference answers
+    MAX_INPUT_TOKENS: int = 2000  # Preference-based prompts above this estimate get their free-text fields trimmed
+    OPENAI_MAX_ATTEMPTS: int = 5  # Attempts per request when OpenAI returns a transient error
+    ITINERARY_BATCH_WINDOW_SECONDS: float = 0.075  # How long itinerary requests wait to be batched together
+    ITINERARY_BATCH_MAX_SIZE: int = 4  # Flush a batch as soon as this many itinerary requests are pending
+    LLM_CACHE_MAXSIZE: int = 1024  # Cached responses kept per OpenAI-backed method
+    RECOMMENDATION_CACHE_MAXSIZE: int = 4096  # Recommendations are shared across users, so more of them are kept
+    TREND_TTL_SECONDS: int = 3600  # Cache lifetime of trend analyses and social media content
+    RECOMMENDATION_TTL_SECONDS: int = 86400  # Cache lifetime of recommendations, destination details and pilgrimage guides
     
     # Travel API settings (mock for now)
     FLIGHT_API_URL: str = "https://mock-flight-api.example.com"
     HOTEL_API_URL: str = "https://mock-hotel-api.example.com"
+    PROVIDER_MAX_CONCURRENCY: int = 8  # Concurrent calls allowed per booking provider
+    ENABLE_MOCK_RESTAURANTS: bool = True  # Fill daily itineraries with generated restaurant suggestions
+    ENABLE_MOCK_TRANSPORT: bool = True  # Fill daily itineraries with generated transportation legs
     
     # hotel specific settings
     PRIORITIZE_MIDDLE_EAST: bool = True
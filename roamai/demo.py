@@ -4,7 +4,6 @@ This script runs a fixed demo without requiring interactive input.
 """
 
 import logging
-import json
 from datetime import datetime, date, timedelta
 import os
 import sys
@@ -87,9 +86,6 @@ def main():
                 itinerary, traveler_details["email"]
             )
             
-            # Convert to dictionary for easier display
-            itinerary_dict = json.loads(itinerary.model_dump_json())
-            
             print("Itinerary created successfully!")
             print()
             
@@ -50,6 +50,14 @@ class UserPreferences(BaseModel):
     previous_destinations: Optional[List[str]] = None
     special_requirements: Optional[str] = None
     
+    def has_interest(self, interest: TravelInterest) -> bool:
+        """Check whether the given interest was selected."""
+        return interest in self.interests
+    
+    def has_style(self, style: TravelStyle) -> bool:
+        """Check whether the given travel style was selected."""
+        return style in self.travel_style
+    
     class Config:
         """Pydantic config."""
         
@@ -77,6 +85,11 @@ class Location(BaseModel):
     region: Optional[str] = None
     latitude: Optional[float] = None
     longitude: Optional[float] = None
+    
+    class Config:
+        """Pydantic config."""
+        
+        frozen = True
 
 
 class Flight(BaseModel):
@@ -102,6 +115,7 @@ class Flight(BaseModel):
     class Config:
         """Pydantic config."""
         
+        frozen = True
         schema_extra = {
             "example": {
                 "flight_id": "FL123456",
@@ -148,6 +162,7 @@ class Accommodation(BaseModel):
     class Config:
         """Pydantic config."""
         
+        frozen = True
         schema_extra = {
             "example": {
                 "accommodation_id": "H123456",
@@ -358,6 +373,7 @@ class Booking(BaseModel):
     class Config:
         """Pydantic config."""
         
+        frozen = True
         schema_extra = {
             "example": {
                 "booking_id": "B123456",
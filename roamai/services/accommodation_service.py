@@ -11,6 +11,7 @@ from typing import List, Optional, Dict, Any
 
 from ..models.travel import Accommodation, Location, UserPreferences, Booking
 from ..core.config import settings
+from ..utils.concurrency import LoopSemaphore, run_in_thread_limited
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
@@ -21,6 +22,8 @@ class AccommodationService:
     
     def __init__(self):
         """Initialize the accommodation service."""
+        # Limits concurrent calls to the provider API
+        self._provider_slots = LoopSemaphore(settings.PROVIDER_MAX_CONCURRENCY)
         self.api_url = settings.HOTEL_API_URL
         # Mock hotel chains
         self.hotel_chains = [
@@ -225,6 +228,28 @@ class AccommodationService:
             logger.error(f"Error booking accommodation: {e}")
             return None
     
+    async def search_accommodations_async(self, *args: Any, **kwargs: Any) -> List[Accommodation]:
+        """
+        Async variant of search_accommodations.
+        
+        The provider call runs in a worker thread so that several searches can
+        be awaited concurrently without blocking the event loop. At most
+        PROVIDER_MAX_CONCURRENCY calls reach the provider at once.
+        
+        Returns:
+            List of available accommodations
+        """
+        return await run_in_thread_limited(self._provider_slots, self.search_accommodations, *args, **kwargs)
+    
+    async def book_accommodation_async(self, *args: Any, **kwargs: Any) -> Optional[Booking]:
+        """
+        Async variant of book_accommodation.
+        
+        Returns:
+            Booking information if successful, None otherwise
+        """
+        return await run_in_thread_limited(self._provider_slots, self.book_accommodation, *args, **kwargs)
+    
     def _get_available_chains(self, prioritize_luxury: bool) -> List[Dict[str, Any]]:
         """
         Get a list of available hotel chains, optionally prioritizing luxury ones.
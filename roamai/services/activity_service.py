@@ -11,6 +11,7 @@ from typing import List, Optional, Dict, Any
 
 from ..models.travel import Activity, Location, UserPreferences, TravelInterest, Booking
 from ..core.config import settings
+from ..utils.concurrency import LoopSemaphore, run_in_thread_limited
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
@@ -21,6 +22,8 @@ class ActivityService:
     
     def __init__(self):
         """Initialize the activity service."""
+        # Limits concurrent calls to the provider API
+        self._provider_slots = LoopSemaphore(settings.PROVIDER_MAX_CONCURRENCY)
         # Map of travel interests to activity categories
         self.interest_to_category = {
             TravelInterest.ADVENTURE: ["Adventure", "Outdoor", "Sports", "Adrenaline"],
@@ -259,6 +262,28 @@ class ActivityService:
             logger.error(f"Error booking activity: {e}")
             return None
     
+    async def search_activities_async(self, *args: Any, **kwargs: Any) -> List[Activity]:
+        """
+        Async variant of search_activities.
+        
+        The provider call runs in a worker thread so that several searches can
+        be awaited concurrently without blocking the event loop. At most
+        PROVIDER_MAX_CONCURRENCY calls reach the provider at once.
+        
+        Returns:
+            List of available activities
+        """
+        return await run_in_thread_limited(self._provider_slots, self.search_activities, *args, **kwargs)
+    
+    async def book_activity_async(self, *args: Any, **kwargs: Any) -> Optional[Booking]:
+        """
+        Async variant of book_activity.
+        
+        Returns:
+            Booking information if successful, None otherwise
+        """
+        return await run_in_thread_limited(self._provider_slots, self.book_activity, *args, **kwargs)
+    
     def _get_region_for_country(self, country: str) -> str:
         """
         Get the region for a country.
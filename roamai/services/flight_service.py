@@ -11,6 +11,7 @@ from typing import List, Optional, Dict, Any
 
 from ..models.travel import Flight, UserPreferences, Booking
 from ..core.config import settings
+from ..utils.concurrency import LoopSemaphore, run_in_thread_limited
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
@@ -21,6 +22,8 @@ class FlightService:
     
     def __init__(self):
         """Initialize the flight service."""
+        # Limits concurrent calls to the provider API
+        self._provider_slots = LoopSemaphore(settings.PROVIDER_MAX_CONCURRENCY)
         self.api_url = settings.FLIGHT_API_URL
         # Mock airline data
         self.airlines = [
@@ -196,6 +199,28 @@ class FlightService:
             logger.error(f"Error booking flight: {e}")
             return None
     
+    async def search_flights_async(self, *args: Any, **kwargs: Any) -> List[Flight]:
+        """
+        Async variant of search_flights.
+        
+        The provider call runs in a worker thread so that several searches can
+        be awaited concurrently without blocking the event loop. At most
+        PROVIDER_MAX_CONCURRENCY calls reach the provider at once.
+        
+        Returns:
+            List of available flights
+        """
+        return await run_in_thread_limited(self._provider_slots, self.search_flights, *args, **kwargs)
+    
+    async def book_flight_async(self, *args: Any, **kwargs: Any) -> Optional[Booking]:
+        """
+        Async variant of book_flight.
+        
+        Returns:
+            Booking information if successful, None otherwise
+        """
+        return await run_in_thread_limited(self._provider_slots, self.book_flight, *args, **kwargs)
+    
     def _get_airport_code(self, location: str) -> str:
         """
         Get airport code for a location, or return the input if it's already a code.
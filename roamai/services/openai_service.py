@@ -2,29 +2,517 @@
 Service for interacting with OpenAI API.
 """
 
+import copy
+import functools
+import itertools
 import json
 import logging
-from typing import Dict, List, Any, Optional, Union
+import random
+import threading
+import time
+from concurrent.futures import Future
+from typing import Callable, Dict, Hashable, Iterator, List, Any, Optional, Tuple, Union
 
+import httpx
 import openai
 from openai import OpenAI
-from pydantic import ValidationError
+from pydantic import BaseModel, TypeAdapter, ValidationError
 
 from ..core.config import settings
-from ..models.travel import UserPreferences, TravelItinerary, Location
+from ..models.travel import UserPreferences, TravelItinerary, Location, TravelInterest, TravelStyle
+from ..utils.cache import TTLCache, preferences_cache_key
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Static request parts shared by every call
+_SYS_RECO = {"role": "system", "content": "You are a travel destination recommendation expert with knowledge of trending destinations, especially in the Middle East and Saudi Arabia. Your task is to recommend destinations based on user preferences."}
+_SYS_ITINERARY = {"role": "system", "content": "You are a travel itinerary planning expert with knowledge of destinations, attractions, restaurants, and travel logistics. Your task is to create a detailed, day-by-day travel itinerary based on user preferences and selected destination."}
+_SYS_TRENDS = {"role": "system", "content": "You are a travel trend analyst with deep knowledge of global travel trends, especially in the Middle East and Saudi Arabia."}
+_SYS_SOCIAL = {"role": "system", "content": "You are a social media analyst specializing in travel content."}
+_SYS_PILGRIMAGE = {"role": "system", "content": "You are a pilgrimage travel specialist with deep knowledge of religious travel to Saudi Arabia."}
+# Reference-style answers are sampled near-deterministically so repeated
+# queries match the response cache; itineraries keep some variety
+_DETERMINISTIC_KW = {"temperature": 0.2, "seed": settings.OPENAI_SEED}
+_ITINERARY_KW = {"temperature": 0.7}
+
+# Transient API failures worth retrying, the backoff bounds in seconds, and
+# the most time a single request may spend waiting between attempts
+_RETRYABLE_ERRORS = (openai.RateLimitError, openai.APIConnectionError, openai.InternalServerError)
+_RETRY_MIN_WAIT = 0.5
+_RETRY_MAX_WAIT = 2.0
+_RETRY_TOTAL_WAIT = 4.0
+
+# Rough characters-per-token ratio used to estimate prompt size locally
+_CHARS_PER_TOKEN = 4
+
+
+class _ItineraryEntry(BaseModel):
+    """Itinerary in a multi-destination response, tagged with the destination it was planned for."""
+    
+    destination_index: Optional[int] = None  # 1-based number of the destination in the prompt
+    itinerary: TravelItinerary
+
+
+# Validate whole response lists in a single pydantic-core call
+_LOCATIONS_ADAPTER = TypeAdapter(List[Location])
+_ITINERARIES_ADAPTER = TypeAdapter(List[_ItineraryEntry])
+_ITIN_RESPONSE_ADAPTER = TypeAdapter(Dict[str, List[_ItineraryEntry]])
+
+# Output format instructions appended to the end of the prompts; the structure
+# itself is enforced through the JSON schema sent as the response format
+_RECO_SCHEMA_TAIL = "\nReturn the destinations in the \"destinations\" array.\n"
+_ITIN_SCHEMA_TAIL = "\nReturn one entry in the \"itineraries\" array per destination, with \"destination_index\" set to the destination's number above and the itinerary under \"itinerary\".\n"
+
+
+def _list_response_schema(key: str, adapter: TypeAdapter) -> Dict[str, Any]:
+    """
+    Build a JSON schema for an object holding a single list under the given key.
+    
+    Args:
+        key: Property name of the list
+        adapter: Type adapter for the list type
+        
+    Returns:
+        JSON schema with the model definitions hoisted to the root
+    """
+    schema = adapter.json_schema()
+    definitions = schema.pop("$defs", {})
+    return {
+        "type": "object",
+        "properties": {key: schema},
+        "required": [key],
+        "$defs": definitions
+    }
+
+
+# Structured output formats. Pydantic schemas contain optional fields and
+# free-form dicts, which OpenAI's strict mode rejects, so responses are still validated.
+_RECO_SCHEMA = _list_response_schema("destinations", _LOCATIONS_ADAPTER)
+_ITIN_SCHEMA = _list_response_schema("itineraries", _ITINERARIES_ADAPTER)
+_RECO_RESPONSE_FORMAT = {"type": "json_schema", "json_schema": {"name": "destination_recommendations", "schema": _RECO_SCHEMA}}
+_ITIN_RESPONSE_FORMAT = {"type": "json_schema", "json_schema": {"name": "travel_itineraries", "schema": _ITIN_SCHEMA}}
+_JSON_OBJECT_FORMAT = {"type": "json_object"}
+
+_CLIENTS: Optional[List[OpenAI]] = None
+_CLIENT_CYCLE: Optional[Iterator[OpenAI]] = None
+_CLIENT_LOCK = threading.Lock()
+
+
+def _get_clients() -> List[OpenAI]:
+    """
+    Get the process-wide OpenAI clients, one per configured API key, creating
+    them on first use.
+    
+    All clients share one HTTP connection pool so that every service instance
+    reuses connections instead of paying for new TLS handshakes.
+    
+    Returns:
+        List of OpenAI clients
+    """
+    global _CLIENTS, _CLIENT_CYCLE
+    if _CLIENTS is None:
+        with _CLIENT_LOCK:
+            if _CLIENTS is None:
+                extra_keys = [k.strip() for k in settings.OPENAI_API_KEYS.split(",") if k.strip()]
+                api_keys = list(dict.fromkeys([settings.OPENAI_API_KEY, *extra_keys]))
+                http_client = httpx.Client(
+                    limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+                    timeout=httpx.Timeout(60.0, connect=5.0)
+                )
+                clients = [
+                    OpenAI(
+                        api_key=api_key,
+                        max_retries=0,  # Retries are handled by OpenAIService._create_completion
+                        http_client=http_client
+                    )
+                    for api_key in api_keys
+                ]
+                _CLIENT_CYCLE = itertools.cycle(clients)
+                _CLIENTS = clients
+    return _CLIENTS
+
+
+def _next_client() -> OpenAI:
+    """
+    Pick the next client round-robin, spreading load over the per-key rate limits.
+    
+    Returns:
+        OpenAI client
+    """
+    _get_clients()
+    with _CLIENT_LOCK:
+        return next(_CLIENT_CYCLE)
+
+
+def _copy_result(result: Union[List[Any], Dict[str, Any]]) -> Union[List[Any], Dict[str, Any]]:
+    """Copy a cached result so that callers cannot mutate the cached value."""
+    return list(result) if isinstance(result, list) else copy.deepcopy(result)
+
+
+def _llm_cache(key_fn: Callable[..., Hashable], ttl: float, maxsize: Optional[int] = None):
+    """
+    Cache the parsed result of an OpenAI-backed method.
+    
+    The cache is shared by all service instances. Empty results, which signal
+    a failed request, are not cached.
+    
+    Callers always get their own copy of a result, so mutating it in place
+    cannot change the cached entry: lists are copied shallowly, since their
+    items are frozen models, and dictionaries of parsed JSON are deep-copied.
+    
+    Args:
+        key_fn: Builds the cache key from the method arguments (without self)
+        ttl: How long a cached result stays valid, in seconds
+        maxsize: Maximum number of cached results, defaults to LLM_CACHE_MAXSIZE
+        
+    Returns:
+        Method decorator
+    """
+    def decorator(func):
+        cache = TTLCache(maxsize=maxsize or settings.LLM_CACHE_MAXSIZE, ttl=ttl)
+        
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            key = key_fn(*args, **kwargs)
+            result = cache.get(key)
+            if result is not None:
+                return _copy_result(result)
+            
+            result = func(self, *args, **kwargs)
+            if result:
+                cache.set(key, _copy_result(result))
+            return result
+        
+        wrapper.cache = cache
+        return wrapper
+    
+    return decorator
+
+
+def _safe_validate_location(item: Dict[str, Any]) -> Optional[Location]:
+    """
+    Validate a single destination entry, logging and skipping bad data.
+    
+    Args:
+        item: Destination entry from the OpenAI response
+        
+    Returns:
+        Location, or None if the entry is invalid
+    """
+    try:
+        return Location(
+            city=item.get("city", ""),
+            country=item.get("country", ""),
+            region=item.get("region", None),
+            latitude=item.get("latitude", None),
+            longitude=item.get("longitude", None)
+        )
+    except (ValidationError, AttributeError) as e:
+        logger.error("Error validating location data: %s", e)
+        return None
+
+
+def _safe_validate_itinerary_entry(item: Dict[str, Any]) -> Optional[_ItineraryEntry]:
+    """
+    Validate a single itinerary entry, logging and skipping bad data.
+    
+    Args:
+        item: Itinerary entry from the OpenAI response
+        
+    Returns:
+        Itinerary entry, or None if the entry is invalid
+    """
+    try:
+        return _ItineraryEntry.model_validate(item)
+    except ValidationError as e:
+        logger.error("Error validating itinerary data: %s", e)
+        return None
+
+
+def _fmt_preferences(preferences: UserPreferences) -> Dict[str, Any]:
+    """
+    Precompute the preference values shared by the prompt builders.
+    
+    Args:
+        preferences: User travel preferences
+        
+    Returns:
+        Dictionary with budget, dates, duration, style and interests
+    """
+    return {
+        "budget": preferences.budget,
+        "dates": f"{preferences.start_date} to {preferences.end_date}",
+        "duration": (preferences.end_date - preferences.start_date).days + 1,
+        "style": ", ".join(s.value for s in preferences.travel_style),
+        "interests": ", ".join(i.value for i in preferences.interests)
+    }
+
+
+def _estimate_tokens(text: str) -> int:
+    """
+    Estimate the number of tokens in a prompt without a tokenizer round-trip.
+    
+    Args:
+        text: Prompt text
+        
+    Returns:
+        Approximate token count
+    """
+    return len(text) // _CHARS_PER_TOKEN + 1
+
+
+def _bounded_prompt(build: Callable[[UserPreferences], str], preferences: UserPreferences) -> str:
+    """
+    Build a prompt, trimming free-text preferences if it would exceed the input token budget.
+    
+    Special requirements are shortened first, then previous destinations are dropped.
+    
+    Args:
+        build: Prompt builder taking the preferences
+        preferences: User travel preferences
+        
+    Returns:
+        Prompt string for OpenAI API
+    """
+    prompt = build(preferences)
+    tokens = _estimate_tokens(prompt)
+    if tokens <= settings.MAX_INPUT_TOKENS:
+        return prompt
+    
+    logger.warning(
+        "Prompt of ~%d tokens exceeds MAX_INPUT_TOKENS=%d, truncating preferences",
+        tokens, settings.MAX_INPUT_TOKENS
+    )
+    
+    excess = (tokens - settings.MAX_INPUT_TOKENS) * _CHARS_PER_TOKEN
+    special_requirements = preferences.special_requirements or ""
+    cut = min(excess, len(special_requirements))
+    special_requirements = special_requirements[:len(special_requirements) - cut]
+    excess -= cut
+    
+    previous_destinations = list(preferences.previous_destinations or [])
+    while excess > 0 and previous_destinations:
+        excess -= len(previous_destinations.pop()) + 2
+    
+    trimmed = preferences.model_copy(update={
+        "special_requirements": special_requirements or None,
+        "previous_destinations": previous_destinations or None
+    })
+    return build(trimmed)
+
+
+def _location_key(location: Location) -> Tuple[str, str]:
+    """Key identifying a destination by its casefolded city and country."""
+    return location.city.casefold(), location.country.casefold()
+
+
+def _match_itineraries(
+    destinations: List[Location],
+    entries: List[_ItineraryEntry]
+) -> List[Optional[TravelItinerary]]:
+    """
+    Assign the itineraries of a multi-destination response to the requested destinations.
+    
+    An entry is matched by its destination index when its country is that of
+    the indexed destination. Entries whose index is missing, out of range,
+    already taken or points at another country go to a free destination with
+    the same city and country. Entries matching no destination are dropped.
+    
+    Args:
+        destinations: Requested destinations, in prompt order
+        entries: Validated entries from the response
+        
+    Returns:
+        Itineraries aligned with destinations, None where none was returned
+    """
+    keys = [_location_key(destination) for destination in destinations]
+    matched: List[Optional[TravelItinerary]] = [None] * len(destinations)
+    unindexed = []
+    for entry in entries:
+        index = entry.destination_index - 1 if entry.destination_index is not None else -1
+        if (
+            0 <= index < len(destinations)
+            and matched[index] is None
+            and _location_key(entry.itinerary.destination)[1] == keys[index][1]
+        ):
+            matched[index] = entry.itinerary
+        else:
+            unindexed.append(entry.itinerary)
+    
+    for itinerary in unindexed:
+        key = _location_key(itinerary.destination)
+        for index, destination_key in enumerate(keys):
+            if matched[index] is None and destination_key == key:
+                matched[index] = itinerary
+                break
+    
+    return matched
+
+
+def _is_plausible_itinerary(itinerary: TravelItinerary) -> bool:
+    """
+    Sanity-check the fields that schema validation cannot catch.
+    
+    Args:
+        itinerary: Validated itinerary
+        
+    Returns:
+        True if the cost and date range make sense
+    """
+    if itinerary.total_cost < 0 or itinerary.end_date < itinerary.start_date:
+        logger.error("Discarding implausible itinerary for %s", itinerary.destination.city)
+        return False
+    return True
+
+
+class _ItineraryBatcher:
+    """
+    Accumulates single-destination itinerary requests for a short window and
+    flushes them to OpenAI as one multi-destination request.
+    """
+    
+    def __init__(self, service: "OpenAIService", window_seconds: float, max_batch_size: int):
+        """
+        Initialize the batcher.
+        
+        Args:
+            service: Service used to issue the batched request
+            window_seconds: How long to wait for more requests before flushing
+            max_batch_size: Number of pending requests that triggers an immediate flush
+        """
+        self._service = service
+        self._window_seconds = window_seconds
+        self._max_batch_size = max_batch_size
+        self._lock = threading.Lock()
+        self._pending: List[Tuple[UserPreferences, Location, Future]] = []
+        self._timer: Optional[threading.Timer] = None
+    
+    def submit(self, preferences: UserPreferences, destination: Location) -> Future:
+        """
+        Queue an itinerary request.
+        
+        Args:
+            preferences: User travel preferences
+            destination: Selected destination
+            
+        Returns:
+            Future resolving to the itinerary, or None if it could not be created
+        """
+        future: Future = Future()
+        batch = None
+        
+        with self._lock:
+            self._pending.append((preferences, destination, future))
+            if len(self._pending) >= self._max_batch_size:
+                batch = self._take_pending()
+            elif self._timer is None:
+                self._timer = threading.Timer(self._window_seconds, self._flush)
+                self._timer.daemon = True
+                self._timer.start()
+        
+        if batch:
+            self._run(batch)
+        
+        return future
+    
+    def _take_pending(self) -> List[Tuple[UserPreferences, Location, Future]]:
+        """Detach the pending requests. Must be called with the lock held."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        return batch
+    
+    def _flush(self) -> None:
+        """Flush whatever is pending when the batching window expires."""
+        with self._lock:
+            batch = self._take_pending()
+        self._run(batch)
+    
+    def _run(self, batch: List[Tuple[UserPreferences, Location, Future]]) -> None:
+        """
+        Issue one request per distinct set of preferences and resolve the futures.
+        
+        Args:
+            batch: Pending (preferences, destination, future) entries
+        """
+        groups: List[Tuple[UserPreferences, List[Tuple[Location, Future]]]] = []
+        for preferences, destination, future in batch:
+            for group_preferences, members in groups:
+                if group_preferences == preferences:
+                    members.append((destination, future))
+                    break
+            else:
+                groups.append((preferences, [(destination, future)]))
+        
+        for preferences, members in groups:
+            destinations = []
+            positions: Dict[Tuple[str, str], int] = {}
+            for destination, _ in members:
+                key = _location_key(destination)
+                if key not in positions:
+                    positions[key] = len(destinations)
+                    destinations.append(destination)
+            
+            try:
+                itineraries = self._service._generate_itineraries(preferences, destinations)
+            except Exception as e:
+                for _, future in members:
+                    future.set_exception(e)
+                continue
+            
+            for destination, future in members:
+                future.set_result(itineraries[positions[_location_key(destination)]])
+
+
 class OpenAIService:
     """Service for interacting with OpenAI API."""
     
     def __init__(self):
         """Initialize the OpenAI service."""
-        self.client = OpenAI(api_key=settings.OPENAI_API_KEY)
+        self.clients = _get_clients()
         self.model = settings.DEFAULT_MODEL
+        self._itinerary_batcher = _ItineraryBatcher(
+            self,
+            window_seconds=settings.ITINERARY_BATCH_WINDOW_SECONDS,
+            max_batch_size=settings.ITINERARY_BATCH_MAX_SIZE
+        )
     
+    def _create_completion(self, messages: List[Dict[str, str]], **kwargs: Any) -> Any:
+        """
+        Call the chat completions API, retrying transient failures with
+        randomized exponential backoff. Each attempt uses the next API key,
+        and retrying stops once the total backoff would exceed _RETRY_TOTAL_WAIT.
+        
+        Args:
+            messages: Chat messages to send
+            **kwargs: Additional request parameters
+            
+        Returns:
+            The chat completion response
+        """
+        waited = 0.0
+        for attempt in range(settings.OPENAI_MAX_ATTEMPTS):
+            try:
+                response = _next_client().chat.completions.create(model=self.model, messages=messages, **kwargs)
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("OpenAI response (%s): %s", response.usage, response.choices[0].message.content)
+                return response
+            except _RETRYABLE_ERRORS as e:
+                delay = random.uniform(_RETRY_MIN_WAIT, min(_RETRY_MAX_WAIT, _RETRY_MIN_WAIT * 2 ** (attempt + 1)))
+                if attempt == settings.OPENAI_MAX_ATTEMPTS - 1 or waited + delay > _RETRY_TOTAL_WAIT:
+                    raise
+                logger.warning("OpenAI request failed (%s), retrying in %.1fs", e, delay)
+                time.sleep(delay)
+                waited += delay
+    
+    @_llm_cache(
+        key_fn=lambda preferences: preferences_cache_key(preferences),
+        ttl=settings.RECOMMENDATION_TTL_SECONDS,
+        maxsize=settings.RECOMMENDATION_CACHE_MAXSIZE
+    )
     def generate_travel_recommendations(
         self, 
         preferences: UserPreferences
@@ -39,18 +527,14 @@ class OpenAIService:
             List of recommended destinations
         """
         # Create a prompt for the OpenAI model
-        prompt = self._create_destination_recommendation_prompt(preferences)
+        prompt = _bounded_prompt(self._create_destination_recommendation_prompt, preferences)
         
         # Call OpenAI API
         try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": "You are a travel destination recommendation expert with knowledge of trending destinations, especially in the Middle East and Saudi Arabia. Your task is to recommend destinations based on user preferences."},
-                    {"role": "user", "content": prompt}
-                ],
-                response_format={"type": "json_object"},
-                temperature=0.7,
+            response = self._create_completion(
+                messages=[_SYS_RECO, {"role": "user", "content": prompt}],
+                response_format=_RECO_RESPONSE_FORMAT,
+                **_DETERMINISTIC_KW,
             )
             
             # Parse the response
@@ -61,25 +545,16 @@ class OpenAIService:
             
             data = json.loads(response_content)
             
-            # Validate and create Location objects
-            locations = []
-            for item in data.get("destinations", []):
-                try:
-                    location = Location(
-                        city=item.get("city", ""),
-                        country=item.get("country", ""),
-                        region=item.get("region", None),
-                        latitude=item.get("latitude", None),
-                        longitude=item.get("longitude", None)
-                    )
-                    locations.append(location)
-                except ValidationError as e:
-                    logger.error(f"Error validating location data: {e}")
-            
-            return locations
+            # Validate and create Location objects, falling back to per-item
+            # validation so that one bad entry doesn't discard the rest
+            items = data.get("destinations", [])
+            try:
+                return _LOCATIONS_ADAPTER.validate_python(items)
+            except ValidationError:
+                return [loc for loc in (_safe_validate_location(item) for item in items) if loc]
             
         except Exception as e:
-            logger.error(f"Error generating travel recommendations: {e}")
+            logger.error("Error generating travel recommendations: %s", e)
             return []
     
     def create_travel_itinerary(
@@ -90,6 +565,9 @@ class OpenAIService:
         """
         Create a comprehensive travel itinerary based on user preferences and selected destination.
         
+        Concurrent calls made within a short window are batched into a single
+        OpenAI request (see create_travel_itineraries).
+        
         Args:
             preferences: User travel preferences
             destination: Selected destination
@@ -97,41 +575,123 @@ class OpenAIService:
         Returns:
             A complete travel itinerary or None if an error occurs
         """
+        try:
+            return self._itinerary_batcher.submit(preferences, destination).result()
+        except Exception as e:
+            logger.error("Error creating travel itinerary: %s", e)
+            return None
+    
+    def create_travel_itineraries(
+        self, 
+        preferences: UserPreferences, 
+        destinations: List[Location]
+    ) -> List[TravelItinerary]:
+        """
+        Create itineraries for several destinations with a single OpenAI request.
+        
+        Args:
+            preferences: User travel preferences
+            destinations: Destinations to plan trips for
+            
+        Returns:
+            Itineraries in the order of the given destinations; destinations
+            the model failed to plan are omitted
+        """
+        if not destinations:
+            return []
+        
+        return [itinerary for itinerary in self._generate_itineraries(preferences, destinations) if itinerary]
+    
+    def _generate_itineraries(
+        self, 
+        preferences: UserPreferences, 
+        destinations: List[Location]
+    ) -> List[Optional[TravelItinerary]]:
+        """
+        Request itineraries for the given destinations in one call.
+        
+        Args:
+            preferences: User travel preferences
+            destinations: Destinations to plan trips for
+            
+        Returns:
+            Itineraries aligned with destinations, None where the model failed
+            to plan a destination
+        """
         # Create a prompt for the OpenAI model
-        prompt = self._create_itinerary_prompt(preferences, destination)
+        prompt = _bounded_prompt(lambda p: self._create_itinerary_prompt(p, destinations), preferences)
         
         # Call OpenAI API
         try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": "You are a travel itinerary planning expert with knowledge of destinations, attractions, restaurants, and travel logistics. Your task is to create a detailed, day-by-day travel itinerary based on user preferences and selected destination."},
-                    {"role": "user", "content": prompt}
-                ],
-                response_format={"type": "json_object"},
-                temperature=0.7,
+            response = self._create_completion(
+                messages=[_SYS_ITINERARY, {"role": "user", "content": prompt}],
+                response_format=_ITIN_RESPONSE_FORMAT,
+                **_ITINERARY_KW,
             )
             
             # Parse the response
             response_content = response.choices[0].message.content
             if not response_content:
                 logger.error("Empty response received from OpenAI API")
-                return None
-            
-            data = json.loads(response_content)
+                return [None] * len(destinations)
             
-            # The structure of the data should be similar to the TravelItinerary model
+            # Parse and validate the whole payload in one pydantic-core pass,
+            # falling back to per-item validation so that one bad entry doesn't
+            # discard the rest
             try:
-                itinerary = TravelItinerary(**data)
-                return itinerary
-            except ValidationError as e:
-                logger.error(f"Error validating itinerary data: {e}")
-                return None
+                validated = _ITIN_RESPONSE_ADAPTER.validate_json(response_content).get("itineraries", [])
+            except ValidationError:
+                items = json.loads(response_content).get("itineraries", [])
+                validated = [entry for entry in (_safe_validate_itinerary_entry(item) for item in items) if entry]
+            
+            return _match_itineraries(
+                destinations,
+                [entry for entry in validated if _is_plausible_itinerary(entry.itinerary)]
+            )
             
         except Exception as e:
-            logger.error(f"Error creating travel itinerary: {e}")
-            return None
+            logger.error("Error creating travel itineraries: %s", e)
+            return [None] * len(destinations)
     
+    @_llm_cache(key_fn=lambda destination: (destination.city, destination.country), ttl=settings.RECOMMENDATION_TTL_SECONDS)
+    def generate_destination_details(self, destination: Location) -> Dict[str, Any]:
+        """
+        Generate descriptive details for a single destination.
+        
+        Recommendations only carry the fields needed to build Location objects;
+        call this lazily for the destination the user actually selects.
+        
+        Args:
+            destination: Destination to describe
+            
+        Returns:
+            Dictionary with description, key attractions, estimated daily cost
+            and best time to visit
+        """
+        # Create a prompt for the OpenAI model
+        prompt = f"Describe {destination.city}, {destination.country} as a travel destination. Format the response as a JSON object with the keys \"description\" (brief description of the destination), \"key_attractions\" (array of attraction names), \"estimated_daily_cost\" (numeric value in USD) and \"best_time_to_visit\" (information about the best time to visit)."
+        
+        # Call OpenAI API
+        try:
+            response = self._create_completion(
+                messages=[_SYS_RECO, {"role": "user", "content": prompt}],
+                response_format=_JSON_OBJECT_FORMAT,
+                **_DETERMINISTIC_KW,
+            )
+            
+            # Parse the response
+            response_content = response.choices[0].message.content
+            if not response_content:
+                logger.error("Empty response received from OpenAI API")
+                return {}
+            
+            return json.loads(response_content)
+            
+        except Exception as e:
+            logger.error("Error generating destination details: %s", e)
+            return {}
+    
+    @_llm_cache(key_fn=lambda region=None: (region or "_ALL_", settings.PRIORITIZE_MIDDLE_EAST), ttl=settings.TREND_TTL_SECONDS)
     def analyze_destination_trends(self, region: Optional[str] = None) -> Dict[str, Any]:
         """
         Analyze trending destinations, particularly focused on Middle East if specified.
@@ -153,14 +713,10 @@ class OpenAIService:
         
         # Call OpenAI API
         try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": "You are a travel trend analyst with deep knowledge of global travel trends, especially in the Middle East and Saudi Arabia."},
-                    {"role": "user", "content": prompt}
-                ],
-                response_format={"type": "json_object"},
-                temperature=0.7,
+            response = self._create_completion(
+                messages=[_SYS_TRENDS, {"role": "user", "content": prompt}],
+                response_format=_JSON_OBJECT_FORMAT,
+                **_DETERMINISTIC_KW,
             )
             
             # Parse the response
@@ -172,9 +728,10 @@ class OpenAIService:
             return json.loads(response_content)
             
         except Exception as e:
-            logger.error(f"Error analyzing destination trends: {e}")
+            logger.error("Error analyzing destination trends: %s", e)
             return {}
     
+    @_llm_cache(key_fn=lambda destination: destination, ttl=settings.TREND_TTL_SECONDS)
     def get_social_media_content(self, destination: str) -> Dict[str, Any]:
         """
         Simulate getting social media content about a destination.
@@ -192,14 +749,10 @@ class OpenAIService:
         
         # Call OpenAI API
         try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": "You are a social media analyst specializing in travel content."},
-                    {"role": "user", "content": prompt}
-                ],
-                response_format={"type": "json_object"},
-                temperature=0.7,
+            response = self._create_completion(
+                messages=[_SYS_SOCIAL, {"role": "user", "content": prompt}],
+                response_format=_JSON_OBJECT_FORMAT,
+                **_DETERMINISTIC_KW,
             )
             
             # Parse the response
@@ -211,9 +764,12 @@ class OpenAIService:
             return json.loads(response_content)
             
         except Exception as e:
-            logger.error(f"Error getting social media content: {e}")
+            logger.error("Error getting social media content: %s", e)
             return {}
     
+    @_llm_cache(key_fn=lambda preferences: (
+        settings.PARTNER_WITH_NUSUK, preferences.has_interest(TravelInterest.PILGRIMAGE)
+    ), ttl=settings.RECOMMENDATION_TTL_SECONDS)
     def process_pilgrimage_requirements(
         self, 
         preferences: UserPreferences
@@ -231,7 +787,7 @@ class OpenAIService:
             return {"error": "Nusuk partnership is not enabled"}
         
         # Check if pilgrimage is among the interests
-        if "PILGRIMAGE" not in [i.value for i in preferences.interests]:
+        if not preferences.has_interest(TravelInterest.PILGRIMAGE):
             return {"error": "User is not interested in pilgrimage travel"}
         
         # Create a prompt for the OpenAI model
@@ -250,14 +806,10 @@ class OpenAIService:
         
         # Call OpenAI API
         try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": "You are a pilgrimage travel specialist with deep knowledge of religious travel to Saudi Arabia."},
-                    {"role": "user", "content": prompt}
-                ],
-                response_format={"type": "json_object"},
-                temperature=0.7,
+            response = self._create_completion(
+                messages=[_SYS_PILGRIMAGE, {"role": "user", "content": prompt}],
+                response_format=_JSON_OBJECT_FORMAT,
+                **_DETERMINISTIC_KW,
             )
             
             # Parse the response
@@ -273,7 +825,7 @@ class OpenAIService:
             return data
             
         except Exception as e:
-            logger.error(f"Error processing pilgrimage requirements: {e}")
+            logger.error("Error processing pilgrimage requirements: %s", e)
             return {}
     
     def _create_destination_recommendation_prompt(self, preferences: UserPreferences) -> str:
@@ -286,120 +838,86 @@ class OpenAIService:
         Returns:
             Prompt string for OpenAI API
         """
-        prompt = "Based on the following user preferences, recommend 5 suitable travel destinations:\n\n"
+        fields = _fmt_preferences(preferences)
+        parts: List[str] = ["Based on the following user preferences, recommend 5 suitable travel destinations:\n\n"]
         
         # Add user preferences to the prompt
         if preferences.destination:
-            prompt += f"Preferred destination: {preferences.destination}\n"
+            parts.append(f"Preferred destination: {preferences.destination}\n")
         else:
-            prompt += "No specific destination preference (open to recommendations)\n"
+            parts.append("No specific destination preference (open to recommendations)\n")
         
-        prompt += f"Budget: ${preferences.budget}\n"
-        prompt += f"Travel dates: {preferences.start_date} to {preferences.end_date}\n"
-        prompt += f"Number of travelers: {preferences.travelers}\n"
-        prompt += f"Travel style: {', '.join([style.value for style in preferences.travel_style])}\n"
-        prompt += f"Interests: {', '.join([interest.value for interest in preferences.interests])}\n"
+        parts.append(f"Budget: ${fields['budget']}\n")
+        parts.append(f"Travel dates: {fields['dates']}\n")
+        parts.append(f"Number of travelers: {preferences.travelers}\n")
+        parts.append(f"Travel style: {fields['style']}\n")
+        parts.append(f"Interests: {fields['interests']}\n")
         
         if preferences.is_flexible_dates:
-            prompt += "Dates are flexible\n"
+            parts.append("Dates are flexible\n")
         
         if preferences.is_flexible_destination:
-            prompt += "Destination is flexible\n"
+            parts.append("Destination is flexible\n")
         
         if preferences.previous_destinations:
-            prompt += f"Previous destinations: {', '.join(preferences.previous_destinations)}\n"
+            parts.append(f"Previous destinations: {', '.join(preferences.previous_destinations)}\n")
         
         if preferences.special_requirements:
-            prompt += f"Special requirements: {preferences.special_requirements}\n"
+            parts.append(f"Special requirements: {preferences.special_requirements}\n")
         
         # Add Almosafer-specific requirements
         if settings.PRIORITIZE_MIDDLE_EAST:
-            prompt += "\nPrioritize destinations in the Middle East and Saudi Arabia, but include other options if they are a better match for the preferences.\n"
+            parts.append("\nPrioritize destinations in the Middle East and Saudi Arabia, but include other options if they are a better match for the preferences.\n")
         
         # Check if pilgrimage is an interest
-        if "PILGRIMAGE" in [i.value for i in preferences.interests]:
-            prompt += "\nInclude options for religious pilgrimage in Saudi Arabia, highlighting Nusuk partnership benefits.\n"
+        if preferences.has_interest(TravelInterest.PILGRIMAGE):
+            parts.append("\nInclude options for religious pilgrimage in Saudi Arabia, highlighting Nusuk partnership benefits.\n")
         
         # Output format instructions
-        prompt += """
-        Format your response as a JSON object with the following structure:
-        {
-            "destinations": [
-                {
-                    "city": "City name",
-                    "country": "Country name",
-                    "region": "Region name",
-                    "description": "Brief description of the destination and why it matches the preferences",
-                    "key_attractions": ["Attraction 1", "Attraction 2", ...],
-                    "estimated_daily_cost": Numeric value in USD,
-                    "best_time_to_visit": "Information about the best time to visit",
-                    "latitude": Numeric latitude value (optional),
-                    "longitude": Numeric longitude value (optional)
-                },
-                ...
-            ]
-        }
-        """
+        parts.append(_RECO_SCHEMA_TAIL)
         
-        return prompt
+        return "".join(parts)
     
-    def _create_itinerary_prompt(self, preferences: UserPreferences, destination: Location) -> str:
+    def _create_itinerary_prompt(self, preferences: UserPreferences, destinations: List[Location]) -> str:
         """
-        Create a prompt for generating a travel itinerary.
+        Create a prompt for generating travel itineraries.
         
         Args:
             preferences: User travel preferences
-            destination: Selected destination
+            destinations: Selected destinations, one itinerary is requested per destination
             
         Returns:
             Prompt string for OpenAI API
         """
-        prompt = f"Create a detailed travel itinerary for a trip to {destination.city}, {destination.country} based on the following user preferences:\n\n"
+        fields = _fmt_preferences(preferences)
+        destination_list = "; ".join(f"{i}. {d.city}, {d.country}" for i, d in enumerate(destinations, 1))
+        parts: List[str] = [f"Create a detailed travel itinerary for a trip to each of the following numbered destinations: {destination_list}. Base every itinerary on the following user preferences:\n\n"]
         
         # Add user preferences to the prompt
-        prompt += f"Budget: ${preferences.budget}\n"
-        prompt += f"Travel dates: {preferences.start_date} to {preferences.end_date}\n"
-        prompt += f"Number of travelers: {preferences.travelers}\n"
-        prompt += f"Travel style: {', '.join([style.value for style in preferences.travel_style])}\n"
-        prompt += f"Interests: {', '.join([interest.value for interest in preferences.interests])}\n"
+        parts.append(f"Budget: ${fields['budget']}\n")
+        parts.append(f"Travel dates: {fields['dates']}\n")
+        parts.append(f"Number of travelers: {preferences.travelers}\n")
+        parts.append(f"Travel style: {fields['style']}\n")
+        parts.append(f"Interests: {fields['interests']}\n")
         
         if preferences.special_requirements:
-            prompt += f"Special requirements: {preferences.special_requirements}\n"
+            parts.append(f"Special requirements: {preferences.special_requirements}\n")
         
         # Add Almosafer-specific requirements
-        if settings.PRIORITIZE_LUXURY and "LUXURY" in [s.value for s in preferences.travel_style]:
-            prompt += "\nPrioritize luxury experiences, high-end accommodations, and premium services.\n"
+        if settings.PRIORITIZE_LUXURY and preferences.has_style(TravelStyle.LUXURY):
+            parts.append("\nPrioritize luxury experiences, high-end accommodations, and premium services.\n")
         
-        # Calculate trip duration
-        start_date = preferences.start_date
-        end_date = preferences.end_date
-        duration = (end_date - start_date).days + 1
-        
-        prompt += f"\nThis is a {duration}-day trip. Please include:\n"
-        prompt += "1. Recommended flights (prioritize luxury airlines if the style is 'luxury')\n"
-        prompt += "2. Accommodation recommendation\n"
-        prompt += "3. Day-by-day itinerary with activities, restaurants, and transportation\n"
-        prompt += "4. Total cost breakdown\n"
+        parts.append(f"\nThis is a {fields['duration']}-day trip. Please include:\n")
+        parts.append("1. Recommended flights (prioritize luxury airlines if the style is 'luxury')\n")
+        parts.append("2. Accommodation recommendation\n")
+        parts.append("3. Day-by-day itinerary with activities, restaurants, and transportation\n")
+        parts.append("4. Total cost breakdown\n")
         
         # Check if pilgrimage is an interest
-        if "PILGRIMAGE" in [i.value for i in preferences.interests]:
-            prompt += "\nInclude religious activities and accommodations near religious sites.\n"
+        if preferences.has_interest(TravelInterest.PILGRIMAGE):
+            parts.append("\nInclude religious activities and accommodations near religious sites.\n")
         
         # Output format instructions
-        prompt += """
-        Format your response to match the TravelItinerary model structure with the following main components:
-        - itinerary_id (a unique string)
-        - user_preferences (the provided preferences)
-        - destination (the location object)
-        - start_date and end_date
-        - flights (array of Flight objects)
-        - accommodation (an Accommodation object)
-        - daily_itineraries (array of DailyItinerary objects, one for each day)
-        - bookings (array of Booking objects for flights, accommodation, etc.)
-        - total_cost (numeric sum of all expenses)
-        - notes (any additional relevant information)
-        
-        Ensure all nested objects follow their respective models with all required fields.
-        """
+        parts.append(_ITIN_SCHEMA_TAIL)
         
-        return prompt
\ No newline at end of file
+        return "".join(parts)
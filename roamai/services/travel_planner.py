@@ -2,15 +2,21 @@
 Travel planner service that coordinates all the other services.
 """
 
+import asyncio
+import functools
 import logging
+import math
 import uuid
 import random
-from datetime import datetime, date, timedelta
+from itertools import chain
+from datetime import datetime, date, time
+from types import SimpleNamespace
 from typing import List, Optional, Dict, Any, Tuple
 
 from ..models.travel import (
     UserPreferences, TravelItinerary, Location, Flight, Accommodation, 
-    Activity, Restaurant, DailyItinerary, Booking, Transportation
+    Activity, Restaurant, DailyItinerary, Booking, Transportation,
+    TravelStyle, TravelInterest
 )
 from ..core.config import settings
 from .openai_service import OpenAIService
@@ -22,15 +28,155 @@ from .activity_service import ActivityService
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Departure time used when searching flights by date
+_MIDNIGHT = time(0, 0)
+
+# Mock data shared by every generated itinerary. Mock models are built with
+# model_construct since their shape is correct by construction; the
+# user-facing TravelItinerary is still validated
+_RESTAURANT_TYPES = ("Local Cuisine", "Fine Dining", "Casual Dining", "Street Food", "Cafe")
+_TRANSPORT_TYPES = ("Taxi", "Public Transport", "Rideshare", "Walking", "Rental Car")
+_TRANSPORT_PRICE_BOUNDS = {
+    "Taxi": (15.0, 30.0),
+    "Public Transport": (1.0, 5.0),
+    "Rideshare": (10.0, 25.0),
+    "Walking": (0.0, 0.0),
+    "Rental Car": (30.0, 60.0)
+}
+_BOOKABLE_TRANSPORT_TYPES = frozenset({"Taxi", "Rideshare", "Rental Car"})
+# Opening hours are shared by every mock restaurant; model_construct needs a
+# plain dict for serialization, so treat this one as read-only
+_DEFAULT_OPENING_HOURS = {
+    "Monday": "11:00-22:00",
+    "Tuesday": "11:00-22:00",
+    "Wednesday": "11:00-22:00",
+    "Thursday": "11:00-22:00",
+    "Friday": "11:00-23:00",
+    "Saturday": "11:00-23:00",
+    "Sunday": "11:00-22:00"
+}
+
+# Phrases describing each travel style in itinerary notes
+_STYLE_PHRASES = {
+    TravelStyle.LUXURY: "luxurious",
+    TravelStyle.BUDGET: "budget-friendly",
+    TravelStyle.FAMILY: "family-oriented",
+    TravelStyle.SOLO: "solo traveler",
+    TravelStyle.COUPLE: "couple's getaway",
+    TravelStyle.GROUP: "group travel",
+    TravelStyle.BUSINESS: "business traveler"
+}
+
+# Mock data does not need cryptographic randomness, so IDs are drawn from a
+# plain PRNG instead of uuid4, which reads from the OS entropy pool every call
+_rng = random.Random()
+
+
+def _mock_id(prefix: str) -> str:
+    """Generate an 8-hex-digit mock identifier."""
+    return f"{prefix}{_rng.getrandbits(32):08X}"
+
+
+# Restaurant builders return (name, cuisine, price range, rating) for one restaurant type
+def _build_local_cuisine(destination: Location, prioritize_luxury: bool, rng: random.Random) -> Tuple[str, List[str], str, float]:
+    """Generate the details of a mock local cuisine restaurant."""
+    name = f"Authentic {destination.city} Kitchen"
+    cuisine = ["Local", destination.country + " Cuisine"]
+    return name, cuisine, "$$" if prioritize_luxury else "$", rng.uniform(4.0, 4.5)
+
+
+def _build_fine_dining(destination: Location, prioritize_luxury: bool, rng: random.Random) -> Tuple[str, List[str], str, float]:
+    """Generate the details of a mock fine dining restaurant."""
+    name = f"The {rng.choice(['Grand', 'Royal', 'Luxe', 'Elite'])} {rng.choice(['Table', 'Bistro', 'Brasserie', 'Garden'])}"
+    cuisine = ["Fine Dining", "International", rng.choice(["French", "Italian", "Japanese", "Fusion"])]
+    return name, cuisine, "$$$$" if prioritize_luxury else "$$$", rng.uniform(4.5, 5.0)
+
+
+def _build_casual_dining(destination: Location, prioritize_luxury: bool, rng: random.Random) -> Tuple[str, List[str], str, float]:
+    """Generate the details of a mock casual dining restaurant."""
+    name = f"{rng.choice(['Sunny', 'Happy', 'Urban', 'Village'])} {rng.choice(['Kitchen', 'Grill', 'Diner', 'Cafe'])}"
+    cuisine = ["Casual", "International", rng.choice(["American", "Mediterranean", "Asian", "Fusion"])]
+    return name, cuisine, "$$", rng.uniform(3.5, 4.5)
+
+
+def _build_street_food(destination: Location, prioritize_luxury: bool, rng: random.Random) -> Tuple[str, List[str], str, float]:
+    """Generate the details of a mock street food restaurant."""
+    name = f"{destination.city} Street Food Market"
+    cuisine = ["Street Food", "Local", "Fast Food"]
+    return name, cuisine, "$", rng.uniform(4.0, 4.8)
+
+
+def _build_cafe(destination: Location, prioritize_luxury: bool, rng: random.Random) -> Tuple[str, List[str], str, float]:
+    """Generate the details of a mock cafe restaurant."""
+    name = f"{rng.choice(['Morning', 'Sunny', 'City', 'Artisan'])} {rng.choice(['Cafe', 'Coffee', 'Bakery', 'Patisserie'])}"
+    cuisine = ["Cafe", "Coffee", "Bakery"]
+    return name, cuisine, "$$" if prioritize_luxury else "$", rng.uniform(4.0, 4.6)
+
+
+_RESTAURANT_BUILDERS = {
+    "Local Cuisine": _build_local_cuisine,
+    "Fine Dining": _build_fine_dining,
+    "Casual Dining": _build_casual_dining,
+    "Street Food": _build_street_food,
+    "Cafe": _build_cafe
+}
+
+
+def _sum_trip(
+    flight_prices: List[float],
+    accommodation_price: float,
+    activity_prices: List[float],
+    transport_prices: List[float]
+) -> float:
+    """
+    Sum the prices making up a trip in a single pass.
+    
+    Kept free of model objects so that callers pricing many candidate
+    itineraries can reuse it on plain price lists.
+    
+    Args:
+        flight_prices: Prices of all flights
+        accommodation_price: Total accommodation price
+        activity_prices: Prices of all activities
+        transport_prices: Prices of all transportation legs
+        
+    Returns:
+        Unrounded total cost
+    """
+    return math.fsum(chain(flight_prices, (accommodation_price,), activity_prices, transport_prices))
+
+
+# Provider services are stateless apart from their clients and lookup data,
+# so every planner shares one instance of each
+@functools.lru_cache(maxsize=1)
+def _openai_service() -> OpenAIService:
+    return OpenAIService()
+
+
+@functools.lru_cache(maxsize=1)
+def _flight_service() -> FlightService:
+    return FlightService()
+
+
+@functools.lru_cache(maxsize=1)
+def _accommodation_service() -> AccommodationService:
+    return AccommodationService()
+
+
+@functools.lru_cache(maxsize=1)
+def _activity_service() -> ActivityService:
+    return ActivityService()
+
+
 class TravelPlannerService:
     """Service for planning and booking complete travel itineraries."""
     
     def __init__(self):
         """Initialize the travel planner service."""
-        self.openai_service = OpenAIService()
-        self.flight_service = FlightService()
-        self.accommodation_service = AccommodationService()
-        self.activity_service = ActivityService()
+        self.openai_service = _openai_service()
+        self.flight_service = _flight_service()
+        self.accommodation_service = _accommodation_service()
+        self.activity_service = _activity_service()
     
     def recommend_destinations(self, preferences: UserPreferences) -> List[Location]:
         """
@@ -56,6 +202,31 @@ class TravelPlannerService:
         """
         Create and book a complete travel itinerary.
         
+        Synchronous wrapper around create_and_book_itinerary_async; must not be
+        called from a running event loop.
+        
+        Args:
+            preferences: User preferences
+            destination: Selected destination
+            traveler_details: Dictionary with traveler information
+            
+        Returns:
+            Complete travel itinerary with bookings
+        """
+        return asyncio.run(self.create_and_book_itinerary_async(preferences, destination, traveler_details))
+    
+    async def create_and_book_itinerary_async(
+        self, 
+        preferences: UserPreferences, 
+        destination: Location,
+        traveler_details: Dict[str, Any]
+    ) -> Optional[TravelItinerary]:
+        """
+        Create and book a complete travel itinerary.
+        
+        Flights, accommodation and activities are independent, so they are
+        searched and booked concurrently.
+        
         Args:
             preferences: User preferences
             destination: Selected destination
@@ -70,14 +241,29 @@ class TravelPlannerService:
             # 1. Create itinerary ID
             itinerary_id = f"ITN{uuid.uuid4().hex[:8].upper()}"
             
-            # 2. Search and book flights
-            flights, flight_bookings = self._handle_flights(preferences, destination, traveler_details)
-            
-            # 3. Search and book accommodation
-            accommodation, accommodation_booking = self._handle_accommodation(preferences, destination, traveler_details)
+            # Determine once the per-itinerary search parameters shared by the handlers
+            prioritize_luxury = settings.PRIORITIZE_LUXURY and preferences.has_style(TravelStyle.LUXURY)
+            ctx = SimpleNamespace(
+                prioritize_luxury=prioritize_luxury,
+                cabin_class="Business" if prioritize_luxury else "Economy",
+                # Assume 1 room for up to 2 travelers, then additional rooms as needed
+                room_count=max(1, (preferences.travelers + 1) // 2),
+                min_rating=4 if prioritize_luxury else 0,
+                accommodation_budget=preferences.budget * 0.4,  # Allocate up to 40% of the budget for accommodation
+                activity_budget=preferences.budget * 0.1  # Allocate up to 10% of the budget per activity per person
+            )
             
-            # 4. Search activities and create daily itineraries
-            daily_itineraries, activity_bookings = self._handle_activities(preferences, destination, traveler_details)
+            # 2-4. Search and book flights and accommodation, and search
+            # activities to create daily itineraries, all at once
+            (
+                (flights, flight_bookings),
+                (accommodation, accommodation_booking),
+                (daily_itineraries, activity_bookings)
+            ) = await asyncio.gather(
+                self._handle_flights(preferences, destination, traveler_details, ctx),
+                self._handle_accommodation(preferences, destination, traveler_details, ctx),
+                self._handle_activities(preferences, destination, traveler_details, ctx)
+            )
             
             # 5. Combine all bookings
             bookings = []
@@ -101,7 +287,7 @@ class TravelPlannerService:
                 daily_itineraries=daily_itineraries,
                 bookings=bookings,
                 total_cost=total_cost,
-                notes=self._generate_itinerary_notes(preferences, destination),
+                notes=self._generate_itinerary_notes(preferences, destination, ctx.prioritize_luxury),
                 created_at=datetime.now(),
                 modified_at=datetime.now()
             )
@@ -112,6 +298,18 @@ class TravelPlannerService:
             logger.error(f"Error creating and booking itinerary: {e}")
             return None
     
+    def get_destination_details(self, destination: Location) -> Dict[str, Any]:
+        """
+        Get descriptive details for a selected destination.
+        
+        Args:
+            destination: Selected destination
+            
+        Returns:
+            Dictionary with destination details
+        """
+        return self.openai_service.generate_destination_details(destination)
+    
     def get_trending_destinations(self, region: Optional[str] = None) -> Dict[str, Any]:
         """
         Get trending destinations.
@@ -148,11 +346,12 @@ class TravelPlannerService:
         """
         return self.openai_service.process_pilgrimage_requirements(preferences)
     
-    def _handle_flights(
+    async def _handle_flights(
         self, 
         preferences: UserPreferences, 
         destination: Location,
-        traveler_details: Dict[str, Any]
+        traveler_details: Dict[str, Any],
+        ctx: SimpleNamespace
     ) -> Tuple[List[Flight], List[Booking]]:
         """
         Search and book flights.
@@ -161,6 +360,7 @@ class TravelPlannerService:
             preferences: User preferences
             destination: Selected destination
             traveler_details: Dictionary with traveler information
+            ctx: Per-itinerary search parameters
             
         Returns:
             Tuple of (list of flights, list of flight bookings)
@@ -168,55 +368,43 @@ class TravelPlannerService:
         origin = traveler_details.get("departure_city", "New York")  # Default origin
         dest_city = destination.city
         
-        # Determine if luxury should be prioritized
-        prioritize_luxury = settings.PRIORITIZE_LUXURY and "LUXURY" in [s.value for s in preferences.travel_style]
-        
-        # Search for outbound flight
-        outbound_flights = self.flight_service.search_flights(
-            origin=origin,
-            destination=dest_city,
-            departure_date=datetime.combine(preferences.start_date, datetime.min.time()),
-            passengers=preferences.travelers,
-            cabin_class="Business" if prioritize_luxury else "Economy",
-            prioritize_luxury=prioritize_luxury
-        )
-        
-        # Search for return flight
-        return_flights = self.flight_service.search_flights(
-            origin=dest_city,
-            destination=origin,
-            departure_date=datetime.combine(preferences.end_date, datetime.min.time()),
-            passengers=preferences.travelers,
-            cabin_class="Business" if prioritize_luxury else "Economy",
-            prioritize_luxury=prioritize_luxury
+        # Search for outbound and return flights concurrently
+        outbound_flights, return_flights = await asyncio.gather(
+            self.flight_service.search_flights_async(
+                origin=origin,
+                destination=dest_city,
+                departure_date=datetime.combine(preferences.start_date, _MIDNIGHT),
+                passengers=preferences.travelers,
+                cabin_class=ctx.cabin_class,
+                prioritize_luxury=ctx.prioritize_luxury
+            ),
+            self.flight_service.search_flights_async(
+                origin=dest_city,
+                destination=origin,
+                departure_date=datetime.combine(preferences.end_date, _MIDNIGHT),
+                passengers=preferences.travelers,
+                cabin_class=ctx.cabin_class,
+                prioritize_luxury=ctx.prioritize_luxury
+            )
         )
         
-        selected_flights = []
-        flight_bookings = []
-        
-        # Book outbound flight (select the first one for simplicity)
-        if outbound_flights:
-            selected_flight = outbound_flights[0]
-            selected_flights.append(selected_flight)
-            booking = self.flight_service.book_flight(selected_flight, traveler_details)
-            if booking:
-                flight_bookings.append(booking)
+        # Select the first outbound and return flight for simplicity
+        selected_flights = [flights[0] for flights in (outbound_flights, return_flights) if flights]
         
-        # Book return flight (select the first one for simplicity)
-        if return_flights:
-            selected_flight = return_flights[0]
-            selected_flights.append(selected_flight)
-            booking = self.flight_service.book_flight(selected_flight, traveler_details)
-            if booking:
-                flight_bookings.append(booking)
+        # Book the selected flights concurrently
+        bookings = await asyncio.gather(
+            *(self.flight_service.book_flight_async(flight, traveler_details) for flight in selected_flights)
+        )
+        flight_bookings = [booking for booking in bookings if booking]
         
         return selected_flights, flight_bookings
     
-    def _handle_accommodation(
+    async def _handle_accommodation(
         self, 
         preferences: UserPreferences, 
         destination: Location,
-        traveler_details: Dict[str, Any]
+        traveler_details: Dict[str, Any],
+        ctx: SimpleNamespace
     ) -> Tuple[Optional[Accommodation], Optional[Booking]]:
         """
         Search and book accommodation.
@@ -225,26 +413,21 @@ class TravelPlannerService:
             preferences: User preferences
             destination: Selected destination
             traveler_details: Dictionary with traveler information
+            ctx: Per-itinerary search parameters
             
         Returns:
             Tuple of (accommodation, accommodation booking)
         """
-        # Determine if luxury should be prioritized
-        prioritize_luxury = settings.PRIORITIZE_LUXURY and "LUXURY" in [s.value for s in preferences.travel_style]
-        
-        # Calculate room count (assume 1 room for up to 2 travelers, then additional rooms as needed)
-        room_count = max(1, (preferences.travelers + 1) // 2)
-        
         # Search for accommodations
-        accommodations = self.accommodation_service.search_accommodations(
+        accommodations = await self.accommodation_service.search_accommodations_async(
             destination=destination,
             check_in_date=preferences.start_date,
             check_out_date=preferences.end_date,
             guests=preferences.travelers,
-            room_count=room_count,
-            min_rating=4 if prioritize_luxury else 0,
-            max_price=preferences.budget * 0.4,  # Allocate up to 40% of the budget for accommodation
-            prioritize_luxury=prioritize_luxury
+            room_count=ctx.room_count,
+            min_rating=ctx.min_rating,
+            max_price=ctx.accommodation_budget,
+            prioritize_luxury=ctx.prioritize_luxury
         )
         
         if not accommodations:
@@ -255,15 +438,16 @@ class TravelPlannerService:
         selected_accommodation = accommodations[0]
         
         # Book the accommodation
-        booking = self.accommodation_service.book_accommodation(selected_accommodation, traveler_details)
+        booking = await self.accommodation_service.book_accommodation_async(selected_accommodation, traveler_details)
         
         return selected_accommodation, booking
     
-    def _handle_activities(
+    async def _handle_activities(
         self, 
         preferences: UserPreferences, 
         destination: Location,
-        traveler_details: Dict[str, Any]
+        traveler_details: Dict[str, Any],
+        ctx: SimpleNamespace
     ) -> Tuple[List[DailyItinerary], List[Booking]]:
         """
         Search for activities and create daily itineraries.
@@ -272,24 +456,68 @@ class TravelPlannerService:
             preferences: User preferences
             destination: Selected destination
             traveler_details: Dictionary with traveler information
+            ctx: Per-itinerary search parameters
             
         Returns:
             Tuple of (list of daily itineraries, list of activity bookings)
         """
-        daily_itineraries = []
         all_bookings = []
         
         # Calculate trip duration
         trip_duration = (preferences.end_date - preferences.start_date).days + 1
         
+        # One slot per day, filled in by day number
+        daily_itineraries: List[Optional[DailyItinerary]] = [None] * trip_duration
+        
+        # Lay out the days of the trip. Skip activity planning for the first and
+        # last day if there are flights (assuming travelers will be busy with
+        # travel on these days)
+        start_ordinal = preferences.start_date.toordinal()
+        travel_days = {1, trip_duration} if trip_duration > 3 else set()
+        days = [
+            (day_number, date.fromordinal(start_ordinal + day_number - 1), day_number in travel_days)
+            for day_number in range(1, trip_duration + 1)
+        ]
+        
+        # Search for activities for all non-travel days concurrently, based on user interests
+        activity_days = [(day_number, day_date) for day_number, day_date, is_travel_day in days if not is_travel_day]
+        search_results = await asyncio.gather(*(
+            self.activity_service.search_activities_async(
+                destination=destination,
+                date=day_date,
+                interests=preferences.interests,
+                travelers=preferences.travelers,
+                max_price_per_person=ctx.activity_budget
+            )
+            for _, day_date in activity_days
+        ))
+        
+        # Select 2-3 activities for each day and book them all concurrently. A
+        # failed booking only drops that activity instead of aborting the trip
+        pairs = [
+            (day_number, activity)
+            for (day_number, _), activities in zip(activity_days, search_results)
+            for activity in activities[:min(3, len(activities))]
+        ]
+        bookings = await asyncio.gather(*(
+            self.activity_service.book_activity_async(activity, traveler_details)
+            for _, activity in pairs
+        ), return_exceptions=True)
+        
+        booked_activities_by_day: Dict[int, List[Activity]] = {day_number: [] for day_number, _ in activity_days}
+        for (day_number, activity), booking in zip(pairs, bookings):
+            if isinstance(booking, Exception):
+                logger.warning("Error booking activity %s: %s", activity.name, booking)
+                continue
+            if booking:
+                all_bookings.append(booking)
+                booked_activities_by_day[day_number].append(activity)
+        
         # For each day of the trip
-        current_date = preferences.start_date
-        for day_number in range(1, trip_duration + 1):
-            # Skip activity planning for the first and last day if there are flights
-            # (assuming travelers will be busy with travel on these days)
-            if (day_number == 1 or day_number == trip_duration) and trip_duration > 3:
+        for day_number, current_date, is_travel_day in days:
+            if is_travel_day:
                 # Add a simple itinerary for travel days
-                daily_itinerary = DailyItinerary(
+                daily_itineraries[day_number - 1] = DailyItinerary.model_construct(
                     date=current_date,
                     day_number=day_number,
                     activities=[],
@@ -297,38 +525,24 @@ class TravelPlannerService:
                     transportation=[],
                     notes="Travel day. No activities planned."
                 )
-                daily_itineraries.append(daily_itinerary)
-                current_date += timedelta(days=1)
                 continue
             
-            # Search for activities for this day based on user interests
-            activities = self.activity_service.search_activities(
-                destination=destination,
-                date=current_date,
-                interests=preferences.interests,
-                travelers=preferences.travelers,
-                max_price_per_person=preferences.budget * 0.1  # Allocate up to 10% of the budget per activity per person
-            )
-            
-            # Select 2-3 activities for the day
-            selected_activities = activities[:min(3, len(activities))]
-            
-            # Book each selected activity
-            booked_activities = []
-            for activity in selected_activities:
-                booking = self.activity_service.book_activity(activity, traveler_details)
-                if booking:
-                    all_bookings.append(booking)
-                    booked_activities.append(activity)
+            booked_activities = booked_activities_by_day[day_number]
             
             # Generate mock restaurant recommendations
-            restaurants = self._generate_mock_restaurants(destination, preferences, current_date)
+            restaurants = (
+                self._generate_mock_restaurants(destination, ctx.prioritize_luxury, current_date)
+                if settings.ENABLE_MOCK_RESTAURANTS else []
+            )
             
             # Generate mock transportation options
-            transportation = self._generate_mock_transportation(destination, booked_activities, current_date)
+            transportation = (
+                self._generate_mock_transportation(destination, booked_activities, current_date)
+                if settings.ENABLE_MOCK_TRANSPORT else []
+            )
             
             # Create daily itinerary
-            daily_itinerary = DailyItinerary(
+            daily_itineraries[day_number - 1] = DailyItinerary.model_construct(
                 date=current_date,
                 day_number=day_number,
                 activities=booked_activities,
@@ -336,16 +550,13 @@ class TravelPlannerService:
                 transportation=transportation,
                 notes=f"Day {day_number} of your {destination.city} adventure."
             )
-            
-            daily_itineraries.append(daily_itinerary)
-            current_date += timedelta(days=1)
         
         return daily_itineraries, all_bookings
     
     def _generate_mock_restaurants(
         self, 
         destination: Location, 
-        preferences: UserPreferences,
+        prioritize_luxury: bool,
         date: date
     ) -> List[Restaurant]:
         """
@@ -353,7 +564,7 @@ class TravelPlannerService:
         
         Args:
             destination: Destination location
-            preferences: User preferences
+            prioritize_luxury: Whether luxury options should be prioritized
             date: Day of the trip
             
         Returns:
@@ -361,61 +572,23 @@ class TravelPlannerService:
         """
         restaurants = []
         
-        # Restaurant types
-        restaurant_types = ["Local Cuisine", "Fine Dining", "Casual Dining", "Street Food", "Cafe"]
-        
-        # Determine if luxury should be prioritized
-        prioritize_luxury = settings.PRIORITIZE_LUXURY and "LUXURY" in [s.value for s in preferences.travel_style]
-        
         # Generate 1-2 restaurant recommendations
-        for _ in range(random.randint(1, 2)):
-            restaurant_type = "Fine Dining" if prioritize_luxury else random.choice(restaurant_types)
-            
-            # Generate restaurant name based on type
-            if restaurant_type == "Local Cuisine":
-                name = f"Authentic {destination.city} Kitchen"
-                cuisine = ["Local", destination.country + " Cuisine"]
-                price_range = "$$" if prioritize_luxury else "$"
-                rating = random.uniform(4.0, 4.5)
-            elif restaurant_type == "Fine Dining":
-                name = f"The {random.choice(['Grand', 'Royal', 'Luxe', 'Elite'])} {random.choice(['Table', 'Bistro', 'Brasserie', 'Garden'])}"
-                cuisine = ["Fine Dining", "International", random.choice(["French", "Italian", "Japanese", "Fusion"])]
-                price_range = "$$$$" if prioritize_luxury else "$$$"
-                rating = random.uniform(4.5, 5.0)
-            elif restaurant_type == "Casual Dining":
-                name = f"{random.choice(['Sunny', 'Happy', 'Urban', 'Village'])} {random.choice(['Kitchen', 'Grill', 'Diner', 'Cafe'])}"
-                cuisine = ["Casual", "International", random.choice(["American", "Mediterranean", "Asian", "Fusion"])]
-                price_range = "$$"
-                rating = random.uniform(3.5, 4.5)
-            elif restaurant_type == "Street Food":
-                name = f"{destination.city} Street Food Market"
-                cuisine = ["Street Food", "Local", "Fast Food"]
-                price_range = "$"
-                rating = random.uniform(4.0, 4.8)
-            else:  # Cafe
-                name = f"{random.choice(['Morning', 'Sunny', 'City', 'Artisan'])} {random.choice(['Cafe', 'Coffee', 'Bakery', 'Patisserie'])}"
-                cuisine = ["Cafe", "Coffee", "Bakery"]
-                price_range = "$" if not prioritize_luxury else "$$"
-                rating = random.uniform(4.0, 4.6)
-            
-            restaurant = Restaurant(
-                restaurant_id=f"R{uuid.uuid4().hex[:8].upper()}",
+        for _ in range(_rng.randint(1, 2)):
+            restaurant_type = "Fine Dining" if prioritize_luxury else _rng.choice(_RESTAURANT_TYPES)
+            
+            # Generate restaurant name and details based on type
+            name, cuisine, price_range, rating = _RESTAURANT_BUILDERS[restaurant_type](destination, prioritize_luxury, _rng)
+            
+            restaurant = Restaurant.model_construct(
+                restaurant_id=_mock_id("R"),
                 name=name,
                 description=f"A {restaurant_type.lower()} restaurant offering {', '.join(cuisine).lower()} in a charming setting.",
                 location=destination,
                 cuisine=cuisine,
                 price_range=price_range,
                 rating=round(rating, 1),
-                reservation_url=f"https://example.com/reserve/{uuid.uuid4().hex[:8]}",
-                opening_hours={
-                    "Monday": "11:00-22:00",
-                    "Tuesday": "11:00-22:00",
-                    "Wednesday": "11:00-22:00",
-                    "Thursday": "11:00-22:00",
-                    "Friday": "11:00-23:00",
-                    "Saturday": "11:00-23:00",
-                    "Sunday": "11:00-22:00"
-                },
+                reservation_url=f"https://example.com/reserve/{_rng.getrandbits(32):08x}",
+                opening_hours=_DEFAULT_OPENING_HOURS,
                 images=[f"https://example.com/images/restaurant{i+1}.jpg" for i in range(2)]
             )
             
@@ -442,74 +615,58 @@ class TravelPlannerService:
         """
         transportation = []
         
-        # Transportation types
-        transport_types = ["Taxi", "Public Transport", "Rideshare", "Walking", "Rental Car"]
-        
         # If there are activities, create transportation between them
         if activities:
             prev_location = "Hotel"
             
             for activity in activities:
-                transport_type = random.choice(transport_types)
-                
-                # Estimate price based on type
-                if transport_type == "Taxi":
-                    price = random.uniform(15, 30)
-                elif transport_type == "Public Transport":
-                    price = random.uniform(1, 5)
-                elif transport_type == "Rideshare":
-                    price = random.uniform(10, 25)
-                elif transport_type == "Walking":
-                    price = 0
-                else:  # Rental Car
-                    price = random.uniform(30, 60)
-                
-                # Create transportation object
-                transport = Transportation(
-                    type=transport_type,
-                    from_location=prev_location,
-                    to_location=activity.name,
-                    date=date,
-                    time=activity.start_time,
-                    price=round(price, 2),
-                    booking_url=f"https://example.com/transportation/{uuid.uuid4().hex[:8]}" if transport_type in ["Taxi", "Rideshare", "Rental Car"] else None,
-                    details=self._generate_transport_details(transport_type)
+                transportation.append(
+                    self._generate_mock_transport(prev_location, activity.name, date, activity.start_time)
                 )
-                
-                transportation.append(transport)
                 prev_location = activity.name
             
-            # Add return transportation to hotel
-            transport_type = random.choice(transport_types)
-            
-            # Estimate price based on type
-            if transport_type == "Taxi":
-                price = random.uniform(15, 30)
-            elif transport_type == "Public Transport":
-                price = random.uniform(1, 5)
-            elif transport_type == "Rideshare":
-                price = random.uniform(10, 25)
-            elif transport_type == "Walking":
-                price = 0
-            else:  # Rental Car
-                price = random.uniform(30, 60)
-            
-            # Create transportation object
-            transport = Transportation(
-                type=transport_type,
-                from_location=prev_location,
-                to_location="Hotel",
-                date=date,
-                time=None,  # Time depends on the last activity's duration
-                price=round(price, 2),
-                booking_url=f"https://example.com/transportation/{uuid.uuid4().hex[:8]}" if transport_type in ["Taxi", "Rideshare", "Rental Car"] else None,
-                details=self._generate_transport_details(transport_type)
-            )
-            
-            transportation.append(transport)
+            # Add return transportation to hotel. Time depends on the last
+            # activity's duration
+            transportation.append(self._generate_mock_transport(prev_location, "Hotel", date, None))
         
         return transportation
     
+    def _generate_mock_transport(
+        self, 
+        from_location: str, 
+        to_location: str,
+        date: date,
+        time: Optional[str]
+    ) -> Transportation:
+        """
+        Generate a single mock transportation leg with a random transport type.
+        
+        Args:
+            from_location: Starting point of the leg
+            to_location: End point of the leg
+            date: Day of the trip
+            time: Departure time, if known
+            
+        Returns:
+            Transportation option
+        """
+        transport_type = _rng.choice(_TRANSPORT_TYPES)
+        
+        # Estimate price based on type
+        low, high = _TRANSPORT_PRICE_BOUNDS[transport_type]
+        price = _rng.uniform(low, high) if high else 0.0
+        
+        return Transportation.model_construct(
+            type=transport_type,
+            from_location=from_location,
+            to_location=to_location,
+            date=date,
+            time=time,
+            price=round(price, 2),
+            booking_url=f"https://example.com/transportation/{_rng.getrandbits(32):08x}" if transport_type in _BOOKABLE_TRANSPORT_TYPES else None,
+            details=self._generate_transport_details(transport_type)
+        )
+    
     def _generate_transport_details(self, transport_type: str) -> Dict[str, Any]:
         """
         Generate details for a transportation option.
@@ -523,21 +680,21 @@ class TravelPlannerService:
         details = {}
         
         if transport_type == "Taxi":
-            details["company"] = random.choice(["City Taxi", "Metro Cab", "Express Taxi"])
-            details["contact"] = f"+1-555-{random.randint(100, 999)}-{random.randint(1000, 9999)}"
+            details["company"] = _rng.choice(["City Taxi", "Metro Cab", "Express Taxi"])
+            details["contact"] = f"+1-555-{_rng.randint(100, 999)}-{_rng.randint(1000, 9999)}"
         elif transport_type == "Public Transport":
-            details["line"] = f"Line {random.choice(['A', 'B', 'C', '1', '2', '3'])}"
-            details["stops"] = random.randint(2, 6)
-            details["frequency"] = f"Every {random.randint(5, 15)} minutes"
+            details["line"] = f"Line {_rng.choice(['A', 'B', 'C', '1', '2', '3'])}"
+            details["stops"] = _rng.randint(2, 6)
+            details["frequency"] = f"Every {_rng.randint(5, 15)} minutes"
         elif transport_type == "Rideshare":
-            details["company"] = random.choice(["Uber", "Lyft", "Careem", "Bolt"])
-            details["estimated_wait"] = f"{random.randint(3, 10)} minutes"
+            details["company"] = _rng.choice(["Uber", "Lyft", "Careem", "Bolt"])
+            details["estimated_wait"] = f"{_rng.randint(3, 10)} minutes"
         elif transport_type == "Walking":
-            details["distance"] = f"{random.uniform(0.5, 2.0):.1f} km"
-            details["estimated_time"] = f"{random.randint(10, 30)} minutes"
+            details["distance"] = f"{_rng.uniform(0.5, 2.0):.1f} km"
+            details["estimated_time"] = f"{_rng.randint(10, 30)} minutes"
         else:  # Rental Car
-            details["company"] = random.choice(["Hertz", "Avis", "Enterprise", "Budget"])
-            details["car_type"] = random.choice(["Economy", "Compact", "Mid-size", "SUV", "Luxury"])
+            details["company"] = _rng.choice(["Hertz", "Avis", "Enterprise", "Budget"])
+            details["car_type"] = _rng.choice(["Economy", "Compact", "Mid-size", "SUV", "Luxury"])
             details["pickup_location"] = "Hotel"
         
         return details
@@ -559,34 +716,26 @@ class TravelPlannerService:
         Returns:
             Total cost
         """
-        total_cost = 0
-        
-        # Add flight costs
-        for flight in flights:
-            total_cost += flight.price
-        
-        # Add accommodation cost
-        if accommodation:
-            total_cost += accommodation.total_price
-        
-        # Add activity costs
-        for day in daily_itineraries:
-            for activity in day.activities:
-                total_cost += activity.total_price
-            
-            # Add transportation costs
-            for transport in day.transportation:
-                total_cost += transport.price
-        
-        return round(total_cost, 2)
+        return round(_sum_trip(
+            [flight.price for flight in flights],
+            accommodation.total_price if accommodation else 0.0,
+            [activity.total_price for day in daily_itineraries for activity in day.activities],
+            [transport.price for day in daily_itineraries for transport in day.transportation]
+        ), 2)
     
-    def _generate_itinerary_notes(self, preferences: UserPreferences, destination: Location) -> str:
+    def _generate_itinerary_notes(
+        self, 
+        preferences: UserPreferences, 
+        destination: Location,
+        prioritize_luxury: bool
+    ) -> str:
         """
         Generate notes for the itinerary.
         
         Args:
             preferences: User preferences
             destination: Selected destination
+            prioritize_luxury: Whether luxury options were prioritized
             
         Returns:
             Notes string
@@ -595,44 +744,28 @@ class TravelPlannerService:
         trip_duration = (preferences.end_date - preferences.start_date).days + 1
         
         # Determine travel style description
-        travel_style = []
-        for style in preferences.travel_style:
-            if style == "LUXURY":
-                travel_style.append("luxurious")
-            elif style == "BUDGET":
-                travel_style.append("budget-friendly")
-            elif style == "FAMILY":
-                travel_style.append("family-oriented")
-            elif style == "SOLO":
-                travel_style.append("solo traveler")
-            elif style == "COUPLE":
-                travel_style.append("couple's getaway")
-            elif style == "GROUP":
-                travel_style.append("group travel")
-            elif style == "BUSINESS":
-                travel_style.append("business traveler")
+        travel_style = [_STYLE_PHRASES[style] for style in preferences.travel_style if style in _STYLE_PHRASES]
         
         # Determine interests description
         interest_list = [i.value for i in preferences.interests]
         
-        # Generate notes
-        notes = f"This {'-'.join(travel_style)} {trip_duration}-day {destination.city} itinerary focuses on "
-        
+        # Describe interests
         if len(interest_list) > 2:
-            notes += f"{', '.join(interest_list[:-1])}, and {interest_list[-1]}"
+            interests = f"{', '.join(interest_list[:-1])}, and {interest_list[-1]}"
         elif len(interest_list) == 2:
-            notes += f"{interest_list[0]} and {interest_list[1]}"
+            interests = f"{interest_list[0]} and {interest_list[1]}"
         else:
-            notes += f"{interest_list[0]}"
+            interests = interest_list[0]
         
-        notes += " as requested."
+        # Generate notes
+        parts = [f"This {'-'.join(travel_style)} {trip_duration}-day {destination.city} itinerary focuses on {interests} as requested."]
         
         # Add note about Almosafer's value
-        if settings.PRIORITIZE_LUXURY and "LUXURY" in [s.value for s in preferences.travel_style]:
-            notes += " We've prioritized premium experiences and luxury accommodations to ensure an exceptional journey."
+        if prioritize_luxury:
+            parts.append(" We've prioritized premium experiences and luxury accommodations to ensure an exceptional journey.")
         
         # Add note about pilgrimage if applicable
-        if "PILGRIMAGE" in [i.value for i in preferences.interests] and settings.PARTNER_WITH_NUSUK:
-            notes += f" As part of our partnership with Nusuk, we've included access to religious sites and activities to enhance your pilgrimage experience with flights from our network of {settings.AIRLINES_COUNT}+ airline partners."
+        if preferences.has_interest(TravelInterest.PILGRIMAGE) and settings.PARTNER_WITH_NUSUK:
+            parts.append(f" As part of our partnership with Nusuk, we've included access to religious sites and activities to enhance your pilgrimage experience with flights from our network of {settings.AIRLINES_COUNT}+ airline partners.")
         
-        return notes
\ No newline at end of file
+        return "".join(parts)
\ No newline at end of file
@@ -15,10 +15,30 @@ from roamai.models.travel import (
     TravelItinerary, Flight, Accommodation, Booking
 )
 
+def at_hour(d: date, hour: int) -> datetime:
+    """Return the datetime at the given hour of a day."""
+    return datetime(d.year, d.month, d.day, hour)
+
+# Sample itinerary shared by repeated runs in the same process
+_SAMPLE_ITINERARY = None
+
+# Values repeated across the sample flights and bookings; the models keep
+# references to these objects, so every booking shares the same strings
+_AIRLINE = "Emirates"
+_CABIN_CLASS = "Business"
+_CONFIRMED = "confirmed"
+_CURRENCY = "USD"
+_PAYMENT_METHOD = "Credit Card"
+
 def create_sample_itinerary():
-    """Create a sample itinerary for testing."""
+    """
+    Create a sample itinerary for testing.
+    
+    The fixture data is already correctly typed, so models are built with
+    model_construct and skip validation.
+    """
     # Create user preferences
-    preferences = UserPreferences(
+    preferences = UserPreferences.model_construct(
         destination="Dubai",
         budget=5000.0,
         start_date=date.today() + timedelta(days=30),
@@ -32,23 +52,23 @@ def create_sample_itinerary():
     )
     
     # Create destination
-    destination = Location(
+    destination = Location.model_construct(
         city="Dubai",
         country="United Arab Emirates",
         region="Middle East"
     )
     
     # Create outbound flight
-    outbound_flight = Flight(
+    outbound_flight = Flight.model_construct(
         flight_id="F001",
-        airline="Emirates",
+        airline=_AIRLINE,
         flight_number="EK203",
         departure_airport="JFK",
         arrival_airport="DXB",
-        departure_time=datetime.combine(preferences.start_date, datetime.min.time()) + timedelta(hours=10),
-        arrival_time=datetime.combine(preferences.start_date, datetime.min.time()) + timedelta(hours=22),
+        departure_time=at_hour(preferences.start_date, 10),
+        arrival_time=at_hour(preferences.start_date, 22),
         duration_minutes=720,
-        cabin_class="Business",
+        cabin_class=_CABIN_CLASS,
         price=1200.50,
         booking_url="https://emirates.com/booking/123",
         stops=0,
@@ -56,16 +76,16 @@ def create_sample_itinerary():
     )
     
     # Create return flight
-    return_flight = Flight(
+    return_flight = Flight.model_construct(
         flight_id="F002",
-        airline="Emirates",
+        airline=_AIRLINE,
         flight_number="EK204",
         departure_airport="DXB",
         arrival_airport="JFK",
-        departure_time=datetime.combine(preferences.end_date, datetime.min.time()) + timedelta(hours=14),
-        arrival_time=datetime.combine(preferences.end_date, datetime.min.time()) + timedelta(hours=20),
+        departure_time=at_hour(preferences.end_date, 14),
+        arrival_time=at_hour(preferences.end_date, 20),
         duration_minutes=840,
-        cabin_class="Business",
+        cabin_class=_CABIN_CLASS,
         price=1300.75,
         booking_url="https://emirates.com/booking/456",
         stops=0,
@@ -73,7 +93,7 @@ def create_sample_itinerary():
     )
     
     # Create accommodation
-    accommodation = Accommodation(
+    accommodation = Accommodation.model_construct(
         accommodation_id="A001",
         name="Burj Al Arab",
         type="Luxury Hotel",
@@ -92,44 +112,44 @@ def create_sample_itinerary():
     )
     
     # Create bookings
-    flight_booking1 = Booking(
+    flight_booking1 = Booking.model_construct(
         booking_id="B001",
         booking_type="flight",
         reference_number="EK123456",
-        status="confirmed",
+        status=_CONFIRMED,
         booking_date=datetime.now(),
         total_price=outbound_flight.price,
-        currency="USD",
-        payment_method="Credit Card",
-        provider="Emirates"
+        currency=_CURRENCY,
+        payment_method=_PAYMENT_METHOD,
+        provider=_AIRLINE
     )
     
-    flight_booking2 = Booking(
+    flight_booking2 = Booking.model_construct(
         booking_id="B002",
         booking_type="flight",
         reference_number="EK789012",
-        status="confirmed",
+        status=_CONFIRMED,
         booking_date=datetime.now(),
         total_price=return_flight.price,
-        currency="USD",
-        payment_method="Credit Card",
-        provider="Emirates"
+        currency=_CURRENCY,
+        payment_method=_PAYMENT_METHOD,
+        provider=_AIRLINE
     )
     
-    accommodation_booking = Booking(
+    accommodation_booking = Booking.model_construct(
         booking_id="B003",
         booking_type="accommodation",
         reference_number="BJ345678",
-        status="confirmed",
+        status=_CONFIRMED,
         booking_date=datetime.now(),
         total_price=accommodation.total_price,
-        currency="USD",
-        payment_method="Credit Card",
+        currency=_CURRENCY,
+        payment_method=_PAYMENT_METHOD,
         provider="Jumeirah"
     )
     
     # Create the itinerary
-    itinerary = TravelItinerary(
+    itinerary = TravelItinerary.model_construct(
         itinerary_id="ITN12345",
         user_preferences=preferences,
         destination=destination,
@@ -149,8 +169,12 @@ def create_sample_itinerary():
 
 def main():
     """Test the notification service."""
-    # Create a sample itinerary
-    itinerary = create_sample_itinerary()
+    global _SAMPLE_ITINERARY
+    
+    # Create a sample itinerary, once per process
+    if _SAMPLE_ITINERARY is None:
+        _SAMPLE_ITINERARY = create_sample_itinerary()
+    itinerary = _SAMPLE_ITINERARY
     
     # Create the notification service
     notification_service = NotificationService()
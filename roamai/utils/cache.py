@@ -0,0 +1,93 @@
+"""
+In-process caching utilities for the RoamAI application.
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+from ..models.travel import UserPreferences
+
+
+class TTLCache:
+    """Thread-safe LRU cache whose entries expire after a fixed time-to-live."""
+    
+    def __init__(self, maxsize: int, ttl: float):
+        """
+        Initialize the cache.
+        
+        Args:
+            maxsize: Maximum number of entries kept; least recently used entries are evicted first
+            ttl: Time-to-live of an entry in seconds
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.RLock()
+    
+    def get(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        """
+        Get a cached value.
+        
+        Args:
+            key: Cache key
+            default: Value returned on a miss or an expired entry
+        
+        Returns:
+            The cached value or default
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return default
+            
+            self._data.move_to_end(key)
+            return value
+    
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Store a value, evicting the least recently used entry if the cache is full.
+        
+        Args:
+            key: Cache key
+            value: Value to store
+        """
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+    
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._data.clear()
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
+
+
+def preferences_cache_key(preferences: UserPreferences) -> str:
+    """
+    Build a canonical, content-addressed cache key for user preferences.
+    
+    Serialization runs entirely in pydantic-core, which encodes dates and
+    enums natively; field order is fixed by the model, so no key sorting is needed.
+    The serialized form is hashed so that long free-text preferences do not
+    inflate the memory held by cache keys.
+    
+    Args:
+        preferences: User travel preferences
+    
+    Returns:
+        Key string that is equal for equal preferences
+    """
+    return hashlib.blake2b(preferences.model_dump_json().encode(), digest_size=16).hexdigest()
@@ -0,0 +1,73 @@
+"""
+Concurrency utilities for the RoamAI application.
+"""
+
+import asyncio
+import threading
+import weakref
+from typing import Any, Callable, TypeVar
+
+T = TypeVar("T")
+
+
+class LoopSemaphore:
+    """
+    Concurrency limit enforced on the event loop, with one asyncio.Semaphore
+    per running loop.
+    
+    asyncio.Semaphore is bound to the loop it is first used on, while a service
+    instance is shared by every loop (the sync planner entry point starts a new
+    loop per call), so each loop gets its own semaphore of the same size. The
+    semaphores are dropped along with their loops.
+    """
+    
+    def __init__(self, value: int):
+        """
+        Initialize the limit.
+        
+        Args:
+            value: Maximum number of concurrent holders per event loop
+        """
+        self._value = value
+        self._semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+    
+    def get(self) -> asyncio.Semaphore:
+        """
+        Get the semaphore of the running event loop, creating it on first use.
+        
+        Returns:
+            Semaphore for the running loop
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            semaphore = self._semaphores.get(loop)
+            if semaphore is None:
+                semaphore = self._semaphores[loop] = asyncio.Semaphore(self._value)
+            return semaphore
+
+
+async def run_in_thread_limited(
+    slots: LoopSemaphore,
+    func: Callable[..., T],
+    *args: Any,
+    **kwargs: Any
+) -> T:
+    """
+    Run a blocking provider call in a worker thread, bounded by a semaphore.
+    
+    A slot is acquired on the event loop before the call is dispatched, so
+    calls waiting for a slot do not hold threads of the loop's default
+    executor, which other blocking work shares.
+    
+    Args:
+        slots: Limit on concurrent calls to the provider
+        func: Blocking function to call
+        *args: Positional arguments for func
+        **kwargs: Keyword arguments for func
+    
+    Returns:
+        The return value of func
+    """
+    async with slots.get():
+        return await asyncio.to_thread(func, *args, **kwargs)
@@ -2,19 +2,30 @@
 Helper functions for the RoamAI application.
 """
 
-import json
+import functools
 import logging
 import random
-import uuid
 from datetime import datetime, date, timedelta
+from os import urandom
 from typing import List, Dict, Any, Optional, Union
 
 from ..models.travel import TravelItinerary
 
-# Setup logging
-logging.basicConfig(level=logging.INFO)
+# Logging is configured by the application entry points
 logger = logging.getLogger(__name__)
 
+# Month names used when formatting dates, indexed by month - 1
+_MONTHS = (
+    "January", "February", "March", "April", "May", "June",
+    "July", "August", "September", "October", "November", "December"
+)
+
+# Value types serialize_dates leaves untouched
+_LEAF_TYPES = frozenset({str, int, float, bool, type(None)})
+
+# Symbols of the currencies that are written before the amount
+_CURRENCY_SYMBOLS = {"USD": "$", "EUR": "€", "GBP": "£"}
+
 
 def generate_id(prefix: str = "") -> str:
     """
@@ -26,13 +37,17 @@ def generate_id(prefix: str = "") -> str:
     Returns:
         Unique ID string
     """
-    return f"{prefix}{uuid.uuid4().hex[:8].upper()}"
+    return f"{prefix}{urandom(4).hex().upper()}"
 
 
+@functools.lru_cache(maxsize=512)
 def format_currency(amount: float, currency: str = "USD") -> str:
     """
     Format a currency amount.
     
+    Results are memoized, since the same amounts recur across the lines of
+    a booking summary.
+    
     Args:
         amount: Amount to format
         currency: Currency code
@@ -40,14 +55,10 @@ def format_currency(amount: float, currency: str = "USD") -> str:
     Returns:
         Formatted currency string
     """
-    if currency == "USD":
-        return f"${amount:.2f}"
-    elif currency == "EUR":
-        return f"€{amount:.2f}"
-    elif currency == "GBP":
-        return f"£{amount:.2f}"
-    else:
-        return f"{amount:.2f} {currency}"
+    symbol = _CURRENCY_SYMBOLS.get(currency)
+    if symbol is not None:
+        return f"{symbol}{amount:.2f}"
+    return f"{amount:.2f} {currency}"
 
 
 def format_datetime(dt: datetime, include_time: bool = True) -> str:
@@ -61,10 +72,10 @@ def format_datetime(dt: datetime, include_time: bool = True) -> str:
     Returns:
         Formatted datetime string
     """
+    formatted = f"{_MONTHS[dt.month - 1]} {dt.day:02d}, {dt.year}"
     if include_time:
-        return dt.strftime("%B %d, %Y at %H:%M")
-    else:
-        return dt.strftime("%B %d, %Y")
+        return f"{formatted} at {dt.hour:02d}:{dt.minute:02d}"
+    return formatted
 
 
 def format_date(d: date) -> str:
@@ -77,7 +88,7 @@ def format_date(d: date) -> str:
     Returns:
         Formatted date string
     """
-    return d.strftime("%B %d, %Y")
+    return f"{_MONTHS[d.month - 1]} {d.day:02d}, {d.year}"
 
 
 def calculate_trip_duration(start_date: date, end_date: date) -> int:
@@ -104,6 +115,14 @@ def parse_date(date_str: str) -> date:
     Returns:
         Date object
     """
+    # Fast path for the canonical zero-padded form; strptime also accepts
+    # unpadded months and days, so it remains the fallback
+    if len(date_str) == 10 and date_str[4] == "-" and date_str[7] == "-":
+        try:
+            return date.fromisoformat(date_str)
+        except ValueError:
+            pass
+    
     try:
         return datetime.strptime(date_str, "%Y-%m-%d").date()
     except ValueError:
@@ -121,7 +140,7 @@ def itinerary_to_dict(itinerary: TravelItinerary) -> Dict[str, Any]:
     Returns:
         Dictionary representation of the itinerary
     """
-    return json.loads(itinerary.model_dump_json())
+    return itinerary.model_dump(mode="json")
 
 
 def dict_to_itinerary(data: Dict[str, Any]) -> TravelItinerary:
@@ -141,20 +160,31 @@ def serialize_dates(obj: Dict[str, Any]) -> Dict[str, Any]:
     """
     Serialize date and datetime objects in a dictionary.
     
+    Only needed for dictionaries built by hand; model output from
+    model_dump(mode="json") or itinerary_to_dict already has ISO dates.
+    
+    Nested dictionaries and lists are walked with an explicit stack and
+    updated in place.
+    
     Args:
         obj: Dictionary possibly containing date and datetime objects
         
     Returns:
         Dictionary with serialized dates
     """
-    for key, value in obj.items():
-        if isinstance(value, datetime):
-            obj[key] = value.isoformat()
-        elif isinstance(value, date):
-            obj[key] = value.isoformat()
-        elif isinstance(value, dict):
-            obj[key] = serialize_dates(value)
-        elif isinstance(value, list):
-            obj[key] = [serialize_dates(item) if isinstance(item, dict) else item for item in value]
+    stack: List[Union[Dict[str, Any], List[Any]]] = [obj]
+    while stack:
+        container = stack.pop()
+        items = container.items() if isinstance(container, dict) else enumerate(container)
+        for key, value in items:
+            # Most values are JSON primitives; an exact type probe skips them
+            # without walking the isinstance checks below
+            if type(value) in _LEAF_TYPES:
+                continue
+            # datetime is a subclass of date
+            if isinstance(value, date):
+                container[key] = value.isoformat()
+            elif isinstance(value, (dict, list)):
+                stack.append(value)
     
     return obj
\ No newline at end of file